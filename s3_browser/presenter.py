@@ -1,16 +1,16 @@
 from __future__ import annotations
 """View-agnostic presenter that wraps controller operations."""
 from dataclasses import replace
+from functools import partial
 import logging
+import queue
 import threading
 from typing import Callable, Iterable
 
-from botocore.exceptions import BotoCoreError, ClientError
-
 from .controller import S3BrowserController
 from .models import BucketInfo, BucketListing, ObjectDetails
 from .profiles import ConnectionProfile
-from .services import TransferCancelledError
+from .services import BOTO_ERRORS, TransferCancelledError
 from .settings import AppSettings, SettingsStorage
 from .ui_utils import PackageInfo, load_package_info
 
@@ -21,12 +21,70 @@ ErrorFn = Callable[[str], None]
 DoneFn = Callable[[], None]
 
 LOGGER = logging.getLogger(__name__)
+IO_MAX_WORKERS = 16
 
 
 def _format_error(exc: Exception) -> str:
     return str(exc)
 
 
+def _call(func: Callable[[], None]) -> None:
+    func()
+
+
+class _DaemonWorkerPool:
+    """Bounded set of daemon threads, so pending S3 calls never delay exit."""
+
+    def __init__(self, max_workers: int, name_prefix: str) -> None:
+        self._max_workers = max_workers
+        self._name_prefix = name_prefix
+        self._tasks: queue.SimpleQueue[Callable[[], None] | None] = queue.SimpleQueue()
+        self._idle = threading.Semaphore(0)
+        self._lock = threading.Lock()
+        self._threads: list[threading.Thread] = []
+        self._closed = False
+
+    def submit(self, task: Callable[[], None]) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._tasks.put(task)
+            if self._idle.acquire(blocking=False) or len(self._threads) >= self._max_workers:
+                return
+            thread = threading.Thread(
+                target=self._work,
+                name=f"{self._name_prefix}_{len(self._threads)}",
+                daemon=True,
+            )
+            self._threads.append(thread)
+        thread.start()
+
+    def shutdown(self) -> None:
+        """Drop queued tasks and let workers exit; running tasks are not awaited."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            while True:
+                try:
+                    self._tasks.get_nowait()
+                except queue.Empty:
+                    break
+            for _ in self._threads:
+                self._tasks.put(None)
+
+    def _work(self) -> None:
+        while True:
+            task = self._tasks.get()
+            if task is None:
+                return
+            try:
+                task()
+            except Exception:
+                LOGGER.exception("Unhandled error in background task")
+            self._idle.release()
+
+
 class S3BrowserPresenter:
     """Runs background operations and returns results via callbacks."""
 
@@ -40,8 +98,10 @@ class S3BrowserPresenter:
         self._controller = controller or S3BrowserController()
         self._settings_storage = settings_storage or SettingsStorage()
         self._settings = self._settings_storage.load()
-        self._dispatch = dispatch or (lambda func: func())
+        self._dispatch = dispatch or _call
         self._package_info = load_package_info()
+        self._workers = _DaemonWorkerPool(IO_MAX_WORKERS, "s3io")
+        self._shutting_down = False
 
     @property
     def settings(self) -> AppSettings:
@@ -59,6 +119,11 @@ class S3BrowserPresenter:
     def selected_profile(self) -> str | None:
         return self._controller.selected_profile
 
+    def shutdown(self) -> None:
+        """Stop accepting work and ask in-flight transfers to cancel."""
+        self._shutting_down = True
+        self._workers.shutdown()
+
     def save_settings(self, settings: AppSettings) -> None:
         self._settings = settings
         self._settings_storage.save(settings)
@@ -109,22 +174,22 @@ class S3BrowserPresenter:
         def task() -> None:
             try:
                 buckets = self._controller.connect_with_profile(profile_name)
-            except (BotoCoreError, ClientError) as exc:
+            except BOTO_ERRORS as exc:
                 LOGGER.exception("Connection error for profile '%s'", profile_name)
                 message = _format_error(exc)
-                self._dispatch(lambda msg=message: on_error(msg))
+                self._dispatch(partial(on_error, message))
             except Exception as exc:
                 LOGGER.exception("Unexpected connection error for profile '%s'", profile_name)
                 message = _format_error(exc)
-                self._dispatch(lambda msg=message: on_error(msg))
+                self._dispatch(partial(on_error, message))
             else:
                 LOGGER.debug("Connected using profile '%s' (%d buckets)", profile_name, len(buckets))
-                self._dispatch(lambda: on_success(buckets))
+                self._dispatch(partial(on_success, buckets))
             finally:
                 if on_done:
                     self._dispatch(on_done)
 
-        threading.Thread(target=task, daemon=True).start()
+        self._submit(task)
 
     def refresh_buckets(
         self,
@@ -137,22 +202,22 @@ class S3BrowserPresenter:
         def task() -> None:
             try:
                 buckets = self._controller.refresh_buckets()
-            except (BotoCoreError, ClientError) as exc:
+            except BOTO_ERRORS as exc:
                 LOGGER.exception("Bucket refresh error")
                 message = _format_error(exc)
-                self._dispatch(lambda msg=message: on_error(msg))
+                self._dispatch(partial(on_error, message))
             except Exception as exc:
                 LOGGER.exception("Unexpected bucket refresh error")
                 message = _format_error(exc)
-                self._dispatch(lambda msg=message: on_error(msg))
+                self._dispatch(partial(on_error, message))
             else:
                 LOGGER.debug("Bucket refresh returned %d bucket(s)", len(buckets))
-                self._dispatch(lambda: on_success(buckets))
+                self._dispatch(partial(on_success, buckets))
             finally:
                 if on_done:
                     self._dispatch(on_done)
 
-        threading.Thread(target=task, daemon=True).start()
+        self._submit(task)
 
     def list_objects(
         self,
@@ -176,26 +241,26 @@ class S3BrowserPresenter:
                     delimiter=delimiter,
                     continuation_token=continuation_token,
                 )
-            except (BotoCoreError, ClientError) as exc:
+            except BOTO_ERRORS as exc:
                 LOGGER.exception("List objects error for bucket '%s'", bucket_name)
                 message = _format_error(exc)
-                self._dispatch(lambda msg=message: on_error(msg))
+                self._dispatch(partial(on_error, message))
             except Exception as exc:
                 LOGGER.exception("Unexpected list objects error for bucket '%s'", bucket_name)
                 message = _format_error(exc)
-                self._dispatch(lambda msg=message: on_error(msg))
+                self._dispatch(partial(on_error, message))
             else:
                 LOGGER.debug(
                     "Listed %d page(s) for bucket '%s'",
                     len(listing.pages),
                     bucket_name,
                 )
-                self._dispatch(lambda: on_success(listing))
+                self._dispatch(partial(on_success, listing))
             finally:
                 if on_done:
                     self._dispatch(on_done)
 
-        threading.Thread(target=task, daemon=True).start()
+        self._submit(task)
 
     def list_object_versions(
         self,
@@ -217,19 +282,19 @@ class S3BrowserPresenter:
                     delimiter=delimiter,
                     continuation_token=continuation_token,
                 )
-            except (BotoCoreError, ClientError) as exc:
+            except BOTO_ERRORS as exc:
                 message = _format_error(exc)
-                self._dispatch(lambda msg=message: on_error(msg))
+                self._dispatch(partial(on_error, message))
             except Exception as exc:
                 message = _format_error(exc)
-                self._dispatch(lambda msg=message: on_error(msg))
+                self._dispatch(partial(on_error, message))
             else:
-                self._dispatch(lambda: on_success(listing))
+                self._dispatch(partial(on_success, listing))
             finally:
                 if on_done:
                     self._dispatch(on_done)
 
-        threading.Thread(target=task, daemon=True).start()
+        self._submit(task)
 
     def get_bucket_info(
         self,
@@ -241,16 +306,16 @@ class S3BrowserPresenter:
         def task() -> None:
             try:
                 info = self._controller.get_bucket_info(bucket_name=bucket_name)
-            except (BotoCoreError, ClientError) as exc:
+            except BOTO_ERRORS as exc:
                 message = _format_error(exc)
-                self._dispatch(lambda msg=message: on_error(msg))
+                self._dispatch(partial(on_error, message))
             except Exception as exc:
                 message = _format_error(exc)
-                self._dispatch(lambda msg=message: on_error(msg))
+                self._dispatch(partial(on_error, message))
             else:
-                self._dispatch(lambda: on_success(info))
+                self._dispatch(partial(on_success, info))
 
-        threading.Thread(target=task, daemon=True).start()
+        self._submit(task)
 
     def get_object_details(
         self,
@@ -266,16 +331,16 @@ class S3BrowserPresenter:
                 details = self._controller.get_object_details(
                     bucket_name=bucket_name, key=key, version_id=version_id
                 )
-            except (BotoCoreError, ClientError) as exc:
+            except BOTO_ERRORS as exc:
                 message = _format_error(exc)
-                self._dispatch(lambda msg=message: on_error(msg))
+                self._dispatch(partial(on_error, message))
             except Exception as exc:
                 message = _format_error(exc)
-                self._dispatch(lambda msg=message: on_error(msg))
+                self._dispatch(partial(on_error, message))
             else:
-                self._dispatch(lambda: on_success(details))
+                self._dispatch(partial(on_success, details))
 
-        threading.Thread(target=task, daemon=True).start()
+        self._submit(task)
 
     def delete_object(
         self,
@@ -289,16 +354,16 @@ class S3BrowserPresenter:
         def task() -> None:
             try:
                 self._controller.delete_object(bucket_name=bucket_name, key=key, version_id=version_id)
-            except (BotoCoreError, ClientError) as exc:
+            except BOTO_ERRORS as exc:
                 message = _format_error(exc)
-                self._dispatch(lambda msg=message: on_error(msg))
+                self._dispatch(partial(on_error, message))
             except Exception as exc:
                 message = _format_error(exc)
-                self._dispatch(lambda msg=message: on_error(msg))
+                self._dispatch(partial(on_error, message))
             else:
                 self._dispatch(on_success)
 
-        threading.Thread(target=task, daemon=True).start()
+        self._submit(task)
 
     def download_object(
         self,
@@ -314,9 +379,7 @@ class S3BrowserPresenter:
         on_cancelled: ErrorFn | None = None,
         on_done: DoneFn | None = None,
     ) -> None:
-        progress_callback = None
-        if on_progress:
-            progress_callback = lambda total: self._dispatch(lambda: on_progress(total))
+        progress_callback = self._coalesce_progress(on_progress) if on_progress else None
 
         def task() -> None:
             try:
@@ -326,20 +389,20 @@ class S3BrowserPresenter:
                     destination=destination,
                     version_id=version_id,
                     progress_callback=progress_callback,
-                    cancel_requested=cancel_requested,
+                    cancel_requested=self._cancel_check(cancel_requested),
                 )
             except TransferCancelledError as exc:
                 if on_cancelled:
                     message = _format_error(exc)
-                    self._dispatch(lambda msg=message: on_cancelled(msg))
-            except (BotoCoreError, ClientError) as exc:
+                    self._dispatch(partial(on_cancelled, message))
+            except BOTO_ERRORS as exc:
                 if on_error:
                     message = _format_error(exc)
-                    self._dispatch(lambda msg=message: on_error(msg))
+                    self._dispatch(partial(on_error, message))
             except Exception as exc:
                 if on_error:
                     message = _format_error(exc)
-                    self._dispatch(lambda msg=message: on_error(msg))
+                    self._dispatch(partial(on_error, message))
             else:
                 if on_success:
                     self._dispatch(on_success)
@@ -347,7 +410,7 @@ class S3BrowserPresenter:
                 if on_done:
                     self._dispatch(on_done)
 
-        threading.Thread(target=task, daemon=True).start()
+        self._submit(task)
 
     def upload_object(
         self,
@@ -365,9 +428,7 @@ class S3BrowserPresenter:
         on_cancelled: ErrorFn | None = None,
         on_done: DoneFn | None = None,
     ) -> None:
-        progress_callback = None
-        if on_progress:
-            progress_callback = lambda total: self._dispatch(lambda: on_progress(total))
+        progress_callback = self._coalesce_progress(on_progress) if on_progress else None
 
         def task() -> None:
             try:
@@ -379,20 +440,20 @@ class S3BrowserPresenter:
                     multipart_chunk_size=multipart_chunk_size,
                     max_concurrency=max_concurrency,
                     progress_callback=progress_callback,
-                    cancel_requested=cancel_requested,
+                    cancel_requested=self._cancel_check(cancel_requested),
                 )
             except TransferCancelledError as exc:
                 if on_cancelled:
                     message = _format_error(exc)
-                    self._dispatch(lambda msg=message: on_cancelled(msg))
-            except (BotoCoreError, ClientError) as exc:
+                    self._dispatch(partial(on_cancelled, message))
+            except BOTO_ERRORS as exc:
                 if on_error:
                     message = _format_error(exc)
-                    self._dispatch(lambda msg=message: on_error(msg))
+                    self._dispatch(partial(on_error, message))
             except Exception as exc:
                 if on_error:
                     message = _format_error(exc)
-                    self._dispatch(lambda msg=message: on_error(msg))
+                    self._dispatch(partial(on_error, message))
             else:
                 if on_success:
                     self._dispatch(on_success)
@@ -400,7 +461,7 @@ class S3BrowserPresenter:
                 if on_done:
                     self._dispatch(on_done)
 
-        threading.Thread(target=task, daemon=True).start()
+        self._submit(task)
 
     def generate_presigned_url(
         self,
@@ -428,16 +489,52 @@ class S3BrowserPresenter:
                     post_key_mode=post_key_mode,
                     max_size=max_size,
                 )
-            except (BotoCoreError, ClientError) as exc:
+            except BOTO_ERRORS as exc:
                 message = _format_error(exc)
-                self._dispatch(lambda msg=message: on_error(msg))
+                self._dispatch(partial(on_error, message))
             except Exception as exc:
                 message = _format_error(exc)
-                self._dispatch(lambda msg=message: on_error(msg))
+                self._dispatch(partial(on_error, message))
             else:
-                self._dispatch(lambda: on_success(result))
+                self._dispatch(partial(on_success, result))
+
+        self._submit(task)
 
-        threading.Thread(target=task, daemon=True).start()
+    def _submit(self, task: Callable[[], None]) -> None:
+        if self._shutting_down:
+            return
+        self._workers.submit(task)
+
+    def _cancel_check(self, cancel_requested: Callable[[], bool] | None) -> Callable[[], bool]:
+        def check() -> bool:
+            return self._shutting_down or bool(cancel_requested and cancel_requested())
+
+        return check
+
+    def _coalesce_progress(self, on_progress: Callable[[int], None]) -> Callable[[int], None]:
+        """Wrap ``on_progress`` so at most one progress update is queued at a time.
+
+        Transfer callbacks fire once per chunk; only the latest total is
+        delivered when the dispatcher gets around to it.
+        """
+        lock = threading.Lock()
+        state = {"latest": 0, "pending": False}
+
+        def deliver() -> None:
+            with lock:
+                total = state["latest"]
+                state["pending"] = False
+            on_progress(total)
+
+        def report(total: int) -> None:
+            with lock:
+                state["latest"] = total
+                if state["pending"]:
+                    return
+                state["pending"] = True
+            self._dispatch(deliver)
+
+        return report
 
     def connect_with_profile_names(self, profiles: Iterable[ConnectionProfile]) -> list[str]:
         return [profile.name for profile in profiles]
@@ -2,13 +2,14 @@ from __future__ import annotations
 """Connection profile models and persistence."""
 from dataclasses import dataclass
 import json
+import os
 from pathlib import Path
 
 import keyring
 from keyring.errors import KeyringError
 
 
-@dataclass
+@dataclass(slots=True)
 class ConnectionProfile:
     """Represents a saved S3 connection."""
 
@@ -137,4 +138,7 @@ class ProfileStorage:
         return names
 
     def _write_data(self, data: list[dict[str, str]]) -> None:
-        self._path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        payload = json.dumps(data, indent=2).encode("utf-8")
+        fd = os.open(self._path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(payload)
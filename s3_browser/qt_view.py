@@ -2,7 +2,9 @@ from __future__ import annotations
 """PySide6-based UI for the S3 browser application."""
 import logging
 import os
+import time
 import uuid
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Callable
 
@@ -21,18 +23,25 @@ from .ui_utils import (
     format_size,
     parse_duration_seconds,
     parse_size_bytes,
+    prefix_segments,
     split_duration_seconds,
     split_size_bytes,
     suggest_command_filename,
 )
 
 NODE_ID_ROLE = QtCore.Qt.UserRole + 1
+PROGRESS_REPAINT_INTERVAL = 1 / 30
+SIZE_CACHE_LIMIT = 512
 LOGGER = logging.getLogger(__name__)
 
 
 class _DispatchBridge(QtCore.QObject):
     run = QtCore.Signal(object)
 
+    @QtCore.Slot(object)
+    def invoke(self, func: Callable[[], None]) -> None:
+        func()
+
 
 @dataclass
 class NodeInfo:
@@ -104,7 +113,7 @@ class S3BrowserWindow(QtWidgets.QMainWindow):
         self.setMinimumSize(640, 480)
 
         self._dispatch_bridge = _DispatchBridge()
-        self._dispatch_bridge.run.connect(lambda func: func())
+        self._dispatch_bridge.run.connect(self._dispatch_bridge.invoke)
         self.presenter = presenter or S3BrowserPresenter(dispatch=self._dispatch)
         self._settings = self.presenter.settings
         self._package_info = self.presenter.package_info
@@ -114,6 +123,8 @@ class S3BrowserWindow(QtWidgets.QMainWindow):
         self._bucket_names: list[str] = []
         self._node_state: dict[str, NodeInfo] = {}
         self._node_items: dict[str, QtGui.QStandardItem] = {}
+        self._current_node_id: str | None = None
+        self._size_cache: OrderedDict[tuple[str, str], int] = OrderedDict()
         self._transfer_dialog: TransferDialog | None = None
 
         self._selected_connection: str = ""
@@ -130,6 +141,10 @@ class S3BrowserWindow(QtWidgets.QMainWindow):
     def _dispatch(self, func: Callable[[], None]) -> None:
         self._dispatch_bridge.run.emit(func)
 
+    def closeEvent(self, event: QtGui.QCloseEvent) -> None:
+        self.presenter.shutdown()
+        super().closeEvent(event)
+
     def _create_menu(self) -> None:
         menubar = self.menuBar()
 
@@ -215,6 +230,7 @@ class S3BrowserWindow(QtWidgets.QMainWindow):
         self._model = QtGui.QStandardItemModel(0, 1, self)
         self.results_tree.setModel(self._model)
         self.results_tree.selectionModel().selectionChanged.connect(self._refresh_selection_controls)
+        self.results_tree.selectionModel().currentChanged.connect(self._handle_current_changed)
         layout.addWidget(self.results_tree, stretch=1)
 
         self.progress = QtWidgets.QProgressBar(self)
@@ -625,14 +641,12 @@ class S3BrowserWindow(QtWidgets.QMainWindow):
                 on_done=self._end_operation,
             )
 
+    def _handle_current_changed(self, current: QtCore.QModelIndex, _previous: QtCore.QModelIndex) -> None:
+        item = self._model.itemFromIndex(current) if current.isValid() else None
+        self._current_node_id = item.data(NODE_ID_ROLE) if item else None
+
     def _get_selected_node(self) -> tuple[str, NodeInfo] | None:
-        index = self.results_tree.currentIndex()
-        if not index.isValid():
-            return None
-        item = self._model.itemFromIndex(index)
-        if not item:
-            return None
-        node_id = item.data(NODE_ID_ROLE)
+        node_id = self._current_node_id
         if not node_id:
             return None
         node_info = self._node_state.get(node_id)
@@ -668,11 +682,7 @@ class S3BrowserWindow(QtWidgets.QMainWindow):
                 return self._selected_bucket, ""
             return None
         _, info = selected
-        if info.node_type == "object":
-            return info.bucket, os.path.dirname(info.key or "") + "/" if info.key else ""
-        if info.node_type in {"prefix", "bucket"}:
-            return info.bucket, info.prefix or ""
-        return None
+        return self._get_upload_target_for_node(info)
 
     def _get_upload_target_from_index(self, index: QtCore.QModelIndex) -> tuple[str, str] | None:
         if index.isValid():
@@ -961,6 +971,7 @@ class S3BrowserWindow(QtWidgets.QMainWindow):
             current = parent
 
     def _remove_object_from_tree(self, bucket: str, key: str) -> bool:
+        self._size_cache.pop((bucket, key), None)
         node_id = self._find_node(node_type="object", bucket=bucket, key=key)
         if not node_id:
             return False
@@ -975,7 +986,7 @@ class S3BrowserWindow(QtWidgets.QMainWindow):
         return True
 
     def _ensure_prefix_chain(self, bucket_item: QtGui.QStandardItem, bucket: str, prefix: str) -> tuple[str | None, bool]:
-        segments = [segment for segment in prefix.strip("/").split("/") if segment]
+        segments = prefix_segments(prefix)
         current_parent = bucket_item
         current_prefix = ""
         created = False
@@ -995,6 +1006,7 @@ class S3BrowserWindow(QtWidgets.QMainWindow):
         return current_parent.data(NODE_ID_ROLE), created
 
     def _add_object_to_tree(self, bucket: str, key: str) -> bool:
+        self._size_cache.pop((bucket, key), None)
         if bucket != self._selected_bucket:
             return False
         bucket_id = self._find_node(node_type="bucket", bucket=bucket)
@@ -1252,42 +1264,66 @@ class S3BrowserWindow(QtWidgets.QMainWindow):
         self._show_error("List Error", f"Error loading {prefix_label}: {message}")
 
     def _delete_child_nodes(self, parent_item: QtGui.QStandardItem) -> None:
-        for row in reversed(range(parent_item.rowCount())):
+        row_count = parent_item.rowCount()
+        if not row_count:
+            return
+        removed: set[str] = set()
+        for row in range(row_count):
             child = parent_item.child(row)
-            if not child:
-                continue
-            node_id = child.data(NODE_ID_ROLE)
-            if node_id:
-                self._delete_subtree(node_id)
-            else:
-                parent_item.removeRow(row)
+            if child:
+                self._collect_subtree_ids(child, removed)
+        self._forget_sizes(removed)
+        self._forget_nodes(removed)
+        parent_item.removeRows(0, row_count)
 
     def _delete_subtree(self, node_id: str) -> None:
         item = self._node_items.get(node_id)
         if not item:
             return
-        self._remove_node_recursive(item)
+        removed: set[str] = set()
+        self._collect_subtree_ids(item, removed)
+        self._forget_sizes(removed)
+        self._forget_nodes(removed)
         parent = item.parent() or self._model.invisibleRootItem()
         parent.removeRow(item.row())
 
-    def _remove_node_recursive(self, item: QtGui.QStandardItem) -> None:
-        for row in reversed(range(item.rowCount())):
-            child = item.child(row)
-            if not child:
-                continue
-            child_id = child.data(NODE_ID_ROLE)
-            if child_id:
-                self._remove_node_recursive(child)
-            item.removeRow(row)
-        node_id = item.data(NODE_ID_ROLE)
-        if node_id:
+    def _forget_nodes(self, node_ids: set[str]) -> None:
+        if len(node_ids) > len(self._node_state) // 2:
+            self._node_state = {k: v for k, v in self._node_state.items() if k not in node_ids}
+            self._node_items = {k: v for k, v in self._node_items.items() if k not in node_ids}
+            return
+        for node_id in node_ids:
             self._node_state.pop(node_id, None)
             self._node_items.pop(node_id, None)
 
+    def _forget_sizes(self, node_ids: set[str]) -> None:
+        """Drop cached sizes for objects under nodes that are being removed."""
+        if not self._size_cache:
+            return
+        for node_id in node_ids:
+            node_info = self._node_state.get(node_id)
+            if node_info and node_info.key:
+                self._size_cache.pop((node_info.bucket, node_info.key), None)
+
+    def _collect_subtree_ids(self, item: QtGui.QStandardItem, node_ids: set[str]) -> None:
+        """Add the node ids of ``item`` and all of its descendants to ``node_ids``."""
+        stack = [item]
+        while stack:
+            current = stack.pop()
+            node_id = current.data(NODE_ID_ROLE)
+            if node_id:
+                node_ids.add(node_id)
+            for row in range(current.rowCount()):
+                child = current.child(row)
+                if child:
+                    stack.append(child)
+
     def _clear_tree(self) -> None:
+        self._current_node_id = None
         self._model.clear()
-        self._node_state.clear()
-        self._node_items.clear()
+        self._node_state = {}
+        self._node_items = {}
+        self._size_cache.clear()
 
     def _set_status(self, message: str) -> None:
         self.status_label.setText(message)
@@ -1310,7 +1346,9 @@ class S3BrowserWindow(QtWidgets.QMainWindow):
             self._transfer_dialog = None
 
     def _report_transfer_progress(self, dialog: TransferDialog, total: int) -> None:
-        if not dialog:
+        # Updates queued before the dialog was closed are dropped rather than
+        # repainting a hidden widget.
+        if not dialog or not dialog.isVisible():
             return
         dialog.update_progress(total)
 
@@ -1411,6 +1449,7 @@ class S3BrowserWindow(QtWidgets.QMainWindow):
         )
 
         def handle_success(details: ObjectDetails) -> None:
+            self._remember_size(bucket, key, details.size)
             dialog.display_details(details)
 
         def handle_error(message: str) -> None:
@@ -1424,6 +1463,15 @@ class S3BrowserWindow(QtWidgets.QMainWindow):
         )
         dialog.exec()
 
+    def _remember_size(self, bucket: str, key: str, size: int | None) -> None:
+        if size is None:
+            return
+        cache_key = (bucket, key)
+        self._size_cache[cache_key] = size
+        self._size_cache.move_to_end(cache_key)
+        if len(self._size_cache) > SIZE_CACHE_LIMIT:
+            self._size_cache.popitem(last=False)
+
     def upload_file(self, *_: object) -> None:
         selection = self._get_selected_upload_target()
         if not selection:
@@ -1542,7 +1590,12 @@ class S3BrowserWindow(QtWidgets.QMainWindow):
             destination, _ = QtWidgets.QFileDialog.getSaveFileName(self, "Save file", filename)
             if not destination:
                 return
-        size_value = details.size if details else None
+        if details:
+            size_value = details.size
+        elif version_id is None:
+            size_value = self._size_cache.get((bucket, key))
+        else:
+            size_value = None
         dialog = self._start_transfer_dialog(
             title="Downloading",
             description=f"Downloading s3://{bucket}/{key}",
@@ -1594,6 +1647,7 @@ class S3BrowserWindow(QtWidgets.QMainWindow):
             dialog = self._start_transfer_dialog(
                 title="Downloading",
                 description=f"Downloading {position}/{total_count}: s3://{bucket}/{key}",
+                total_bytes=self._size_cache.get((bucket, key)),
             )
 
             def handle_success() -> None:
@@ -1770,8 +1824,14 @@ class TransferDialog(QtWidgets.QDialog):
         self.setModal(True)
         self._total_bytes = total_bytes or 0
         self._indeterminate = not total_bytes or total_bytes <= 0
+        self._total_label = "" if self._indeterminate else format_size(self._total_bytes)
         self._transferred = 0
+        self._last_paint = 0.0
         self._cancel_requested = False
+        self._repaint_timer = QtCore.QTimer(self)
+        self._repaint_timer.setSingleShot(True)
+        self._repaint_timer.setInterval(round(PROGRESS_REPAINT_INTERVAL * 1000))
+        self._repaint_timer.timeout.connect(self._paint_progress)
 
         layout = QtWidgets.QVBoxLayout(self)
         layout.setContentsMargins(15, 15, 15, 15)
@@ -1807,19 +1867,40 @@ class TransferDialog(QtWidgets.QDialog):
 
     def update_progress(self, transferred: int) -> None:
         self._transferred = max(transferred, 0)
+        if not self._indeterminate and self._transferred > self._total_bytes:
+            # The expected size was stale (e.g. a cached size for an object that
+            # has since been overwritten), so stop claiming a percentage.
+            self._indeterminate = True
+            self._total_bytes = 0
+            self._total_label = ""
+            self.progress.setRange(0, 0)
+        finished = not self._indeterminate and self._transferred >= self._total_bytes
+        if time.monotonic() - self._last_paint < PROGRESS_REPAINT_INTERVAL and not finished:
+            # Repaint once the interval elapses so the last skipped total still shows.
+            if not self._repaint_timer.isActive():
+                self._repaint_timer.start()
+            return
+        self._repaint_timer.stop()
+        self._paint_progress()
+
+    def _paint_progress(self) -> None:
+        self._last_paint = time.monotonic()
         if self._indeterminate:
             self.progress_label.setText(f"{format_size(self._transferred)} transferred")
         else:
             maximum = max(self._total_bytes, 1)
             percent = min(self._transferred / maximum, 1.0)
             self.progress.setValue(min(self._transferred, maximum))
-            total_label = format_size(self._total_bytes)
             self.progress_label.setText(
-                f"{format_size(self._transferred)} of {total_label} ({percent:.0%})"
+                f"{format_size(self._transferred)} of {self._total_label} ({percent:.0%})"
             )
         if not self._cancel_requested:
             self.status_label.setText("Transferring...")
 
+    def hideEvent(self, event: QtGui.QHideEvent) -> None:
+        self._repaint_timer.stop()
+        super().hideEvent(event)
+
     def cancel_requested(self) -> bool:
         return self._cancel_requested
 
@@ -1909,25 +1990,23 @@ class ConnectionDialog(QtWidgets.QDialog):
         return self.result
 
     def _fields_filled(self) -> bool:
-        return all(
-            [
-                self.name_edit.text().strip(),
-                self.endpoint_edit.text().strip(),
-                self.access_key_edit.text().strip(),
-                self.secret_key_edit.text().strip(),
-            ]
+        return bool(
+            self.name_edit.text().strip()
+            and self.endpoint_edit.text().strip()
+            and self.access_key_edit.text().strip()
+            and self.secret_key_edit.text().strip()
         )
 
     def _has_changes(self) -> bool:
-        if not self._original_values:
+        original = self._original_values
+        if not original:
             return True
-        current = {
-            "name": self.name_edit.text().strip(),
-            "endpoint_url": self.endpoint_edit.text().strip(),
-            "access_key": self.access_key_edit.text().strip(),
-            "secret_key": self.secret_key_edit.text().strip(),
-        }
-        return current != self._original_values
+        return (
+            self.name_edit.text().strip() != original["name"]
+            or self.endpoint_edit.text().strip() != original["endpoint_url"]
+            or self.access_key_edit.text().strip() != original["access_key"]
+            or self.secret_key_edit.text().strip() != original["secret_key"]
+        )
 
     def _resolve_primary_action(self) -> str:
         if self._connect_on_save and self._original_values and not self._has_changes():
@@ -1984,6 +2063,8 @@ class ConnectionDialog(QtWidgets.QDialog):
 class ObjectDetailsDialog(QtWidgets.QDialog):
     """Modal dialog that loads and displays metadata for an object."""
 
+    _DETAIL_LABELS = ("Bucket", "Key", "Size", "Last modified", "Storage class", "ETag", "Content type")
+
     def __init__(
         self,
         parent: QtWidgets.QWidget,
@@ -2020,7 +2101,7 @@ class ObjectDetailsDialog(QtWidgets.QDialog):
         self.details_group = QtWidgets.QGroupBox("Details")
         details_layout = QtWidgets.QFormLayout(self.details_group)
         self._detail_fields = {}
-        for label in ["Bucket", "Key", "Size", "Last modified", "Storage class", "ETag", "Content type"]:
+        for label in self._DETAIL_LABELS:
             field = QtWidgets.QLineEdit("-")
             field.setReadOnly(True)
             details_layout.addRow(f"{label}:", field)
@@ -2079,9 +2160,11 @@ class ObjectDetailsDialog(QtWidgets.QDialog):
         self._detail_fields["Storage class"].setText(details.storage_class or "-")
         self._detail_fields["ETag"].setText(details.etag or "-")
         self._detail_fields["Content type"].setText(details.content_type or "-")
-        checksums_value = "\n".join(f"{k}: {v}" for k, v in sorted(details.checksums.items())) or "None"
+        checksum_items = sorted(details.checksums.items())
+        checksums_value = "\n".join([f"{k}: {v}" for k, v in checksum_items]) or "None"
         self.checksums_text.setPlainText(checksums_value)
-        metadata_value = "\n".join(f"{k}: {v}" for k, v in sorted(details.metadata.items())) or "None"
+        metadata_items = sorted(details.metadata.items())
+        metadata_value = "\n".join([f"{k}: {v}" for k, v in metadata_items]) or "None"
         self.metadata_text.setPlainText(metadata_value)
         if details.version_id:
             self._detail_fields["Version ID"].setText(details.version_id)
@@ -2257,6 +2340,8 @@ class SignedUrlDialog(QtWidgets.QDialog):
         self._bucket = bucket
         self._default_max_size = default_max_size
         self._post_fields: dict[str, str] | None = None
+        self._method = "get"
+        self._post_mode = "single"
 
         layout = QtWidgets.QVBoxLayout(self)
         form = QtWidgets.QFormLayout()
@@ -2305,6 +2390,7 @@ class SignedUrlDialog(QtWidgets.QDialog):
         size_layout.addWidget(self.max_size_edit)
         size_layout.addWidget(self.max_size_unit)
         form.addRow("Max file size:", size_layout)
+        self._post_widgets = (self.max_size_edit, self.max_size_unit, post_single, post_prefix)
 
         expiry_value, expiry_unit = split_duration_seconds(default_expiry)
         self.expires_edit = QtWidgets.QLineEdit(expiry_value)
@@ -2353,7 +2439,8 @@ class SignedUrlDialog(QtWidgets.QDialog):
         layout.addLayout(button_row)
 
         self.key_edit.textChanged.connect(self._update_full_path)
-        self.method_group.buttonToggled.connect(lambda *_: self._toggle_post_options())
+        self.method_group.buttonToggled.connect(self._on_method_toggled)
+        self.post_mode_group.buttonToggled.connect(self._on_post_mode_toggled)
         self._update_full_path()
         self._toggle_post_options()
 
@@ -2365,22 +2452,23 @@ class SignedUrlDialog(QtWidgets.QDialog):
     def _toggle_post_options(self) -> None:
         method = self._current_method()
         is_post = method == "post"
-        self.max_size_edit.setEnabled(is_post)
-        self.max_size_unit.setEnabled(is_post)
-        for button in self.post_mode_group.buttons():
-            button.setEnabled(is_post)
+        for widget in self._post_widgets:
+            widget.setEnabled(is_post)
+
+    def _on_method_toggled(self, button: QtWidgets.QAbstractButton, checked: bool) -> None:
+        if checked:
+            self._method = button.property("method")
+            self._toggle_post_options()
+
+    def _on_post_mode_toggled(self, button: QtWidgets.QAbstractButton, checked: bool) -> None:
+        if checked:
+            self._post_mode = button.property("post_mode")
 
     def _current_method(self) -> str:
-        for button in self.method_group.buttons():
-            if button.isChecked():
-                return button.property("method")
-        return "get"
+        return self._method
 
     def _current_post_mode(self) -> str:
-        for button in self.post_mode_group.buttons():
-            if button.isChecked():
-                return button.property("post_mode")
-        return "single"
+        return self._post_mode
 
     def _on_generate(self) -> None:
         key = self.key_edit.text().strip()
@@ -37,6 +37,8 @@ PAGE_SIZE = 50
 DEFAULT_MULTIPART_THRESHOLD = 8 * 1024 * 1024
 DEFAULT_MULTIPART_CHUNK_SIZE = 8 * 1024 * 1024
 DEFAULT_MAX_CONCURRENCY = 10
+MAX_POOL_CONNECTIONS = 20
+BOTO_ERRORS = (ClientError, BotoCoreError)
 
 
 class S3BrowserService:
@@ -120,8 +122,14 @@ class S3BrowserService:
             continuation_token=continuation_token,
         )
 
-    def _create_client(self, endpoint_url: str, access_key: str, secret_key: str):
-        config = Config(signature_version="s3v4")
+    def _create_client(
+        self,
+        endpoint_url: str,
+        access_key: str,
+        secret_key: str,
+        max_pool_connections: int = MAX_POOL_CONNECTIONS,
+    ):
+        config = Config(signature_version="s3v4", max_pool_connections=max_pool_connections)
         return self._client_factory(
             "s3",
             endpoint_url=endpoint_url,
@@ -183,7 +191,7 @@ class S3BrowserService:
                     next_continuation_token = response_token
                     has_more = True
                 break
-            except (ClientError, BotoCoreError) as exc:  # pragma: no cover - passthrough
+            except BOTO_ERRORS as exc:  # pragma: no cover - passthrough
                 pages.append(ObjectPage(number=page_number, keys=[], error=str(exc)))
                 bucket_error = str(exc)
                 break
@@ -268,7 +276,7 @@ class S3BrowserService:
                 has_more = True
                 next_token = response.get("NextKeyMarker")
 
-        except (ClientError, BotoCoreError) as exc:
+        except BOTO_ERRORS as exc:
             pages.append(ObjectPage(number=1, error=str(exc)))
 
         return BucketListing(
@@ -301,13 +309,13 @@ class S3BrowserService:
                 versioning_status = "Suspended"
             else:
                 versioning_status = "Disabled"
-        except (ClientError, BotoCoreError):
+        except BOTO_ERRORS:
             versioning_status = "Unknown"
 
         try:
             location_response = client.get_bucket_location(Bucket=bucket_name)
             region = location_response.get("LocationConstraint") or "us-east-1"
-        except (ClientError, BotoCoreError):
+        except BOTO_ERRORS:
             region = None
 
         return BucketInfo(
@@ -374,8 +382,15 @@ class S3BrowserService:
         extra_args = {}
         if version_id:
             extra_args["VersionId"] = version_id
+        transfer_config = TransferConfig(
+            multipart_threshold=DEFAULT_MULTIPART_THRESHOLD,
+            multipart_chunksize=DEFAULT_MULTIPART_CHUNK_SIZE,
+            max_concurrency=DEFAULT_MAX_CONCURRENCY,
+            use_threads=True,
+        )
         client.download_file(bucket_name, key, destination, Callback=callback,
-                             ExtraArgs=extra_args if extra_args else None)
+                             ExtraArgs=extra_args if extra_args else None,
+                             Config=transfer_config)
 
     def upload_object(
         self,
@@ -394,7 +409,6 @@ class S3BrowserService:
     ) -> None:
         """Upload a local file to the target bucket/key."""
 
-        client = self._create_client(endpoint_url, access_key, secret_key)
         callback = self._build_transfer_callback(progress_callback, cancel_requested)
         threshold_value = multipart_threshold if multipart_threshold is not None else DEFAULT_MULTIPART_THRESHOLD
         if threshold_value <= 0:
@@ -405,6 +419,13 @@ class S3BrowserService:
         concurrency_value = max_concurrency if max_concurrency is not None else DEFAULT_MAX_CONCURRENCY
         if concurrency_value <= 0:
             concurrency_value = DEFAULT_MAX_CONCURRENCY
+        # Give every transfer worker its own pooled connection.
+        client = self._create_client(
+            endpoint_url,
+            access_key,
+            secret_key,
+            max_pool_connections=max(MAX_POOL_CONNECTIONS, concurrency_value),
+        )
         transfer_config = TransferConfig(
             multipart_threshold=threshold_value,
             multipart_chunksize=chunk_value,
@@ -1,17 +1,23 @@
 from __future__ import annotations
 """UI-agnostic helpers for formatting and command generation."""
+import re
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from importlib.metadata import PackageNotFoundError, metadata, version
 
 DIST_NAME = "pys3b"
 SIZE_UNITS = ("B", "KB", "MB", "GB")
+SIZE_SUFFIXES = SIZE_UNITS + ("TB",)
+CURL_POST_PREFIX = ("curl", "-X", "POST")
+_DOUBLE_QUOTE_SPECIAL_RE = re.compile(r'[\\"$`]')
 SIZE_UNIT_FACTORS = {
     "B": 1,
     "KB": 1024,
     "MB": 1024 * 1024,
     "GB": 1024 * 1024 * 1024,
 }
+LAST_MODIFIED_FORMAT = "%Y-%m-%d %H:%M:%S %Z"
 DURATION_UNITS = ("Seconds", "Minutes", "Hours", "Days")
 DURATION_UNIT_FACTORS = {
     "seconds": 1,
@@ -19,6 +25,7 @@ DURATION_UNIT_FACTORS = {
     "hours": 60 * 60,
     "days": 60 * 60 * 24,
 }
+DURATION_LABEL_FACTORS = {label: DURATION_UNIT_FACTORS[label.lower()] for label in DURATION_UNITS}
 
 
 @dataclass(frozen=True)
@@ -31,6 +38,7 @@ class PackageInfo:
     author: str | None
 
 
+@lru_cache(maxsize=4)
 def load_package_info(dist_name: str = DIST_NAME) -> PackageInfo:
     try:
         distribution_metadata = metadata(dist_name)
@@ -83,7 +91,7 @@ def parse_size_bytes(value: str, unit: str) -> int | None:
         return None
     if amount <= 0:
         return None
-    factor = SIZE_UNIT_FACTORS.get(unit.strip().upper())
+    factor = SIZE_UNIT_FACTORS.get(unit) or SIZE_UNIT_FACTORS.get(unit.strip().upper())
     if not factor:
         return None
     return amount * factor
@@ -105,7 +113,7 @@ def parse_duration_seconds(value: str, unit: str) -> int | None:
         return None
     if amount <= 0:
         return None
-    factor = DURATION_UNIT_FACTORS.get(unit.strip().lower())
+    factor = DURATION_LABEL_FACTORS.get(unit) or DURATION_UNIT_FACTORS.get(unit.strip().lower())
     if not factor:
         return None
     return amount * factor
@@ -114,31 +122,38 @@ def parse_duration_seconds(value: str, unit: str) -> int | None:
 def format_size(size: int | None) -> str:
     if size is None:
         return "-"
-    suffixes = ["B", "KB", "MB", "GB", "TB"]
-    value = float(max(size, 0))
-    for suffix in suffixes:
-        if value < 1024 or suffix == suffixes[-1]:
-            return f"{value:.1f} {suffix}" if suffix != "B" else f"{int(value)} {suffix}"
-        value /= 1024
-    return f"{size} B"
+    if size < 1024:
+        return f"{max(size, 0)} B"
+    idx = min((size.bit_length() - 1) // 10, len(SIZE_SUFFIXES) - 1)
+    return f"{size / (1 << (idx * 10)):.1f} {SIZE_SUFFIXES[idx]}"
 
 
 def format_last_modified(last_modified: object) -> str:
     if not last_modified:
         return "-"
     if isinstance(last_modified, datetime):
-        return last_modified.strftime("%Y-%m-%d %H:%M:%S %Z").strip() or last_modified.isoformat()
-    try:
-        return last_modified.strftime("%Y-%m-%d %H:%M:%S %Z").strip() or str(last_modified)
-    except AttributeError:
+        return last_modified.strftime(LAST_MODIFIED_FORMAT).strip() or last_modified.isoformat()
+    strftime = getattr(last_modified, "strftime", None)
+    if strftime is None:
         return str(last_modified)
+    return strftime(LAST_MODIFIED_FORMAT).strip() or str(last_modified)
+
+
+@lru_cache(maxsize=4096)
+def normalize_prefix(prefix: str) -> str:
+    return prefix.strip().lstrip("/")
+
+
+@lru_cache(maxsize=4096)
+def prefix_segments(prefix: str) -> tuple[str, ...]:
+    return tuple(segment for segment in prefix.strip("/").split("/") if segment)
 
 
 def compose_s3_key(prefix: str, name: str) -> str:
     key_name = name.strip()
     if not key_name:
         raise ValueError("Object name cannot be empty")
-    cleaned_prefix = prefix.strip().lstrip("/")
+    cleaned_prefix = normalize_prefix(prefix)
     if cleaned_prefix and not cleaned_prefix.endswith("/"):
         cleaned_prefix += "/"
     return f"{cleaned_prefix}{key_name}" if cleaned_prefix else key_name
@@ -146,10 +161,13 @@ def compose_s3_key(prefix: str, name: str) -> str:
 
 def suggest_command_filename(key: str) -> str:
     cleaned = key.strip().rstrip("/")
-    if not cleaned:
-        return "local-file"
-    name = cleaned.rsplit("/", 1)[-1]
-    return name or "local-file"
+    return cleaned[cleaned.rfind("/") + 1:] or "local-file"
+
+
+def escape_double_quoted(value: str) -> str:
+    if not _DOUBLE_QUOTE_SPECIAL_RE.search(value):
+        return value
+    return _DOUBLE_QUOTE_SPECIAL_RE.sub(r"\\\g<0>", value)
 
 
 def build_signed_url_commands(
@@ -162,6 +180,8 @@ def build_signed_url_commands(
     post_fields: dict[str, str] | None = None,
 ) -> tuple[str | None, str | None]:
     normalized = (method or "get").strip().lower()
+    url = escape_double_quoted(url)
+    filename = escape_double_quoted(filename)
     if normalized == "get":
         wget_cmd = f'wget "{url}" -O "{filename}"'
         curl_cmd = f'curl -L "{url}" -o "{filename}"'
@@ -169,20 +189,26 @@ def build_signed_url_commands(
 
     if normalized == "post":
         fields = post_fields or {}
-        curl_parts = ["curl", "-X", "POST"]
-        ordered_keys = [key for key in ("key",) if key in fields]
-        ordered_keys.extend(sorted(key for key in fields.keys() if key not in ordered_keys))
+        curl_parts = list(CURL_POST_PREFIX)
+        ordered_keys = ["key"] if "key" in fields else []
+        ordered_keys += sorted(fields.keys() - {"key"})
         for key in ordered_keys:
-            curl_parts.append(f'-F "{key}={fields[key]}"')
+            curl_parts.append(f'-F "{escape_double_quoted(key)}={escape_double_quoted(fields[key])}"')
         curl_parts.append('-F "file=@PATH_TO_FILE"')
         curl_parts.append(f'"{url}"')
         return None, " ".join(curl_parts)
 
+    if not content_type and not content_disposition:
+        return (
+            f'wget --method=PUT --body-file="{filename}" "{url}"',
+            f'curl -T "{filename}" "{url}"',
+        )
+
     headers: list[tuple[str, str]] = []
     if content_type:
-        headers.append(("Content-Type", content_type))
+        headers.append(("Content-Type", escape_double_quoted(content_type)))
     if content_disposition:
-        headers.append(("Content-Disposition", content_disposition))
+        headers.append(("Content-Disposition", escape_double_quoted(content_disposition)))
 
     wget_parts = ["wget", "--method=PUT", f'--body-file="{filename}"']
     curl_parts = ["curl", f'-T "{filename}"']
@@ -0,0 +1,19 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+
+class ModuleTempDir:
+    """One temporary directory per test module, with a JSON path per test."""
+
+    def __init__(self):
+        self._tmpdir: tempfile.TemporaryDirectory | None = None
+
+    def create(self) -> None:
+        self._tmpdir = tempfile.TemporaryDirectory()
+
+    def cleanup(self) -> None:
+        self._tmpdir.cleanup()
+
+    def path_for(self, test: unittest.TestCase) -> Path:
+        return Path(self._tmpdir.name) / f"{test.id()}.json"
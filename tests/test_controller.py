@@ -1,11 +1,19 @@
-import tempfile
 import unittest
-from pathlib import Path
+from dataclasses import replace
 
 from s3_browser.controller import NotConnectedError, S3BrowserController
 from s3_browser.models import BucketInfo, BucketListing, ObjectDetails
 from s3_browser.profiles import ConnectionProfile, ProfileStorage
 
+from tests.tempdir import ModuleTempDir
+
+
+_TMP = ModuleTempDir()
+_ALPHA = ConnectionProfile(name="alpha", endpoint_url="https://one", access_key="a", secret_key="b")
+
+setUpModule = _TMP.create
+tearDownModule = _TMP.cleanup
+
 
 class FakeService:
     def __init__(self):
@@ -190,34 +198,45 @@ class FakeProfileStorage:
         return list(self._profiles)
 
     def save(self, profiles):
-        snapshot = [ConnectionProfile(**profile.__dict__) for profile in profiles]
+        snapshot = [replace(profile) for profile in profiles]
         self.saved_snapshots.append(snapshot)
         self._profiles = snapshot
 
 
 class S3BrowserControllerTests(unittest.TestCase):
+    params = {
+        "endpoint_url": "https://example.com",
+        "access_key": "access",
+        "secret_key": "secret",
+    }
+
     def setUp(self):
         self.fake_service = FakeService()
         self.storage = FakeProfileStorage()
         self.controller = S3BrowserController(service=self.fake_service, storage=self.storage)
-        self.params = {
-            "endpoint_url": "https://example.com",
-            "access_key": "access",
-            "secret_key": "secret",
-        }
 
     def test_connect_stores_connection_and_returns_buckets(self):
         buckets = self.controller.connect(**self.params)
 
         self.assertEqual(["bucket-one"], buckets)
         self.assertTrue(self.controller.is_connected)
-        self.assertEqual(1, len(self.fake_service.list_buckets_calls))
-        self.assertEqual(self.params, self.fake_service.list_buckets_calls[0])
-
-    def test_refresh_requires_existing_connection(self):
-        with self.assertRaises(NotConnectedError):
-            self.controller.refresh_buckets()
+        self.assertEqual([self.params], self.fake_service.list_buckets_calls)
+
+    def test_methods_require_connection(self):
+        cases = [
+            ("refresh_buckets", {}),
+            ("list_objects", {"bucket_name": "bucket-one"}),
+            ("list_object_versions", {"bucket_name": "bucket-one"}),
+            ("get_object_details", {"bucket_name": "bucket-one", "key": "file.txt"}),
+            ("get_bucket_info", {"bucket_name": "bucket-one"}),
+            ("download_object", {"bucket_name": "bucket-one", "key": "file.txt", "destination": "/tmp/file.txt"}),
+            ("upload_object", {"bucket_name": "bucket-one", "key": "file.txt", "source_path": "/tmp/file.txt"}),
+        ]
+        for name, kwargs in cases:
+            with self.subTest(method=name), self.assertRaises(NotConnectedError):
+                getattr(self.controller, name)(**kwargs)
 
+    def test_refresh_reuses_existing_connection(self):
         self.controller.connect(**self.params)
         self.fake_service.buckets = ["other"]
 
@@ -227,25 +246,23 @@ class S3BrowserControllerTests(unittest.TestCase):
         self.assertEqual(2, len(self.fake_service.list_buckets_calls))
         self.assertEqual(self.params, self.fake_service.list_buckets_calls[1])
 
-    def test_list_objects_requires_connection_and_passes_params(self):
-        with self.assertRaises(NotConnectedError):
-            self.controller.list_objects(bucket_name="bucket-one")
-
+    def test_list_objects_passes_params(self):
         self.controller.connect(**self.params)
         listing = self.controller.list_objects(bucket_name="bucket-one", max_keys=25)
 
         self.assertIs(listing, self.fake_service.bucket_listing)
-        self.assertEqual(1, len(self.fake_service.list_objects_calls))
         self.assertEqual(
-            {
-                **self.params,
-                "bucket_name": "bucket-one",
-                "max_keys": 25,
-                "prefix": "",
-                "delimiter": "/",
-                "continuation_token": None,
-            },
-            self.fake_service.list_objects_calls[0],
+            [
+                {
+                    **self.params,
+                    "bucket_name": "bucket-one",
+                    "max_keys": 25,
+                    "prefix": "",
+                    "delimiter": "/",
+                    "continuation_token": None,
+                }
+            ],
+            self.fake_service.list_objects_calls,
         )
 
     def test_list_objects_supports_prefix(self):
@@ -262,31 +279,24 @@ class S3BrowserControllerTests(unittest.TestCase):
 
         self.assertEqual("token-1", self.fake_service.list_objects_calls[0]["continuation_token"])
 
-    def test_get_object_details_requires_connection(self):
-        with self.assertRaises(NotConnectedError):
-            self.controller.get_object_details(bucket_name="bucket-one", key="file.txt")
-
     def test_get_object_details_passes_through_params(self):
         self.controller.connect(**self.params)
 
         details = self.controller.get_object_details(bucket_name="bucket-one", key="file.txt")
 
         self.assertIs(details, self.fake_service.object_details)
-        self.assertEqual(1, len(self.fake_service.object_details_calls))
         self.assertEqual(
-            {
-                **self.params,
-                "bucket_name": "bucket-one",
-                "key": "file.txt",
-                "version_id": None,
-            },
-            self.fake_service.object_details_calls[0],
+            [
+                {
+                    **self.params,
+                    "bucket_name": "bucket-one",
+                    "key": "file.txt",
+                    "version_id": None,
+                }
+            ],
+            self.fake_service.object_details_calls,
         )
 
-    def test_download_object_requires_connection(self):
-        with self.assertRaises(NotConnectedError):
-            self.controller.download_object(bucket_name="bucket-one", key="file.txt", destination="/tmp/file.txt")
-
     def test_download_object_passes_through_params(self):
         self.controller.connect(**self.params)
 
@@ -296,26 +306,19 @@ class S3BrowserControllerTests(unittest.TestCase):
             destination="/tmp/file.txt",
         )
 
-        self.assertEqual(1, len(self.fake_service.download_calls))
         self.assertEqual(
-            {
-                **self.params,
-                "bucket_name": "bucket-one",
-                "key": "file.txt",
-                "destination": "/tmp/file.txt",
-                "version_id": None,
-            },
-            self.fake_service.download_calls[0],
+            [
+                {
+                    **self.params,
+                    "bucket_name": "bucket-one",
+                    "key": "file.txt",
+                    "destination": "/tmp/file.txt",
+                    "version_id": None,
+                }
+            ],
+            self.fake_service.download_calls,
         )
 
-    def test_upload_object_requires_connection(self):
-        with self.assertRaises(NotConnectedError):
-            self.controller.upload_object(
-                bucket_name="bucket-one",
-                key="file.txt",
-                source_path="/tmp/file.txt",
-            )
-
     def test_upload_object_passes_through_params(self):
         self.controller.connect(**self.params)
 
@@ -328,79 +331,45 @@ class S3BrowserControllerTests(unittest.TestCase):
             max_concurrency=7,
         )
 
-        self.assertEqual(1, len(self.fake_service.upload_calls))
         self.assertEqual(
-            {
-                **self.params,
-                "bucket_name": "bucket-one",
-                "key": "file.txt",
-                "source_path": "/tmp/file.txt",
-                "multipart_threshold": 123,
-                "multipart_chunk_size": 456,
-                "max_concurrency": 7,
-            },
-            self.fake_service.upload_calls[0],
+            [
+                {
+                    **self.params,
+                    "bucket_name": "bucket-one",
+                    "key": "file.txt",
+                    "source_path": "/tmp/file.txt",
+                    "multipart_threshold": 123,
+                    "multipart_chunk_size": 456,
+                    "max_concurrency": 7,
+                }
+            ],
+            self.fake_service.upload_calls,
         )
 
     def test_loads_profiles_from_storage_on_init(self):
-        profiles = [
-            ConnectionProfile(
-                name="alpha",
-                endpoint_url="https://one",
-                access_key="a",
-                secret_key="b",
-            )
-        ]
+        profiles = [_ALPHA]
         storage = FakeProfileStorage(profiles)
         controller = S3BrowserController(service=self.fake_service, storage=storage)
 
         self.assertEqual(profiles, controller.list_profiles())
 
     def test_save_profile_creates_and_updates_profiles(self):
-        profile = ConnectionProfile(
-            name="alpha",
-            endpoint_url="https://one",
-            access_key="a",
-            secret_key="b",
-        )
-        self.controller.save_profile(profile)
-        self.assertEqual([profile], self.controller.list_profiles())
+        self.controller.save_profile(_ALPHA)
+        self.assertEqual([_ALPHA], self.controller.list_profiles())
 
-        updated = ConnectionProfile(
-            name="alpha",
-            endpoint_url="https://two",
-            access_key="c",
-            secret_key="d",
-        )
+        updated = replace(_ALPHA, endpoint_url="https://two", access_key="c", secret_key="d")
         self.controller.save_profile(updated)
         self.assertEqual([updated], self.controller.list_profiles())
         self.assertEqual(updated.endpoint_url, self.storage._profiles[0].endpoint_url)
 
     def test_save_profile_supports_renaming(self):
-        existing = ConnectionProfile(
-            name="alpha",
-            endpoint_url="https://one",
-            access_key="a",
-            secret_key="b",
-        )
-        self.controller.save_profile(existing)
-        renamed = ConnectionProfile(
-            name="beta",
-            endpoint_url="https://one",
-            access_key="a",
-            secret_key="b",
-        )
+        self.controller.save_profile(_ALPHA)
+        renamed = replace(_ALPHA, name="beta")
         self.controller.save_profile(renamed, original_name="alpha")
         self.assertEqual([renamed], self.controller.list_profiles())
 
     def test_delete_profile_removes_and_persists(self):
-        profile = ConnectionProfile(
-            name="alpha",
-            endpoint_url="https://one",
-            access_key="a",
-            secret_key="b",
-        )
-        self.controller.save_profile(profile)
+        self.controller.save_profile(_ALPHA)
         self.controller.delete_profile("alpha")
         self.assertEqual([], self.controller.list_profiles())
         self.assertEqual([], self.storage._profiles)
@@ -419,20 +388,17 @@ class S3BrowserControllerTests(unittest.TestCase):
         buckets = self.controller.connect_with_profile("alpha")
 
         self.assertEqual(["bucket-one"], buckets)
-        self.assertEqual(1, len(self.fake_service.list_buckets_calls))
         self.assertEqual(
-            {
-                "endpoint_url": "https://example",
-                "access_key": "ak",
-                "secret_key": "sk",
-            },
-            self.fake_service.list_buckets_calls[0],
+            [
+                {
+                    "endpoint_url": "https://example",
+                    "access_key": "ak",
+                    "secret_key": "sk",
+                }
+            ],
+            self.fake_service.list_buckets_calls,
         )
 
-    def test_list_object_versions_requires_connection(self):
-        with self.assertRaises(NotConnectedError):
-            self.controller.list_object_versions(bucket_name="bucket-one")
-
     def test_list_object_versions_passes_through_params(self):
         self.controller.connect(**self.params)
 
@@ -441,16 +407,17 @@ class S3BrowserControllerTests(unittest.TestCase):
         )
 
         self.assertIs(listing, self.fake_service.versions_listing)
-        self.assertEqual(1, len(self.fake_service.list_versions_calls))
         self.assertEqual(
-            {
-                **self.params,
-                "bucket_name": "bucket-one",
-                "prefix": "folder/",
-                "delimiter": "/",
-                "continuation_token": "marker",
-            },
-            self.fake_service.list_versions_calls[0],
+            [
+                {
+                    **self.params,
+                    "bucket_name": "bucket-one",
+                    "prefix": "folder/",
+                    "delimiter": "/",
+                    "continuation_token": "marker",
+                }
+            ],
+            self.fake_service.list_versions_calls,
         )
 
     def test_get_object_details_passes_version_id(self):
@@ -460,48 +427,43 @@ class S3BrowserControllerTests(unittest.TestCase):
 
         self.assertEqual("v42", self.fake_service.object_details_calls[0]["version_id"])
 
-    def test_get_bucket_info_requires_connection(self):
-        with self.assertRaises(NotConnectedError):
-            self.controller.get_bucket_info(bucket_name="bucket-one")
-
     def test_get_bucket_info_passes_through_params(self):
         self.controller.connect(**self.params)
 
         info = self.controller.get_bucket_info(bucket_name="bucket-one")
 
         self.assertIs(info, self.fake_service.bucket_info)
-        self.assertEqual(1, len(self.fake_service.bucket_info_calls))
         self.assertEqual(
-            {
-                **self.params,
-                "bucket_name": "bucket-one",
-            },
-            self.fake_service.bucket_info_calls[0],
+            [
+                {
+                    **self.params,
+                    "bucket_name": "bucket-one",
+                }
+            ],
+            self.fake_service.bucket_info_calls,
         )
 
 
 class ProfileStorageTests(unittest.TestCase):
     def test_save_and_load_roundtrip(self):
-        with tempfile.TemporaryDirectory() as tmp:
-            path = Path(tmp) / "connections.json"
-            storage = ProfileStorage(path)
-            profiles = [
-                ConnectionProfile(name="alpha", endpoint_url="https://one", access_key="a", secret_key="b"),
-                ConnectionProfile(name="beta", endpoint_url="https://two", access_key="c", secret_key="d"),
-            ]
-            storage.save(profiles)
+        path = _TMP.path_for(self)
+        storage = ProfileStorage(path)
+        profiles = [
+            _ALPHA,
+            ConnectionProfile(name="beta", endpoint_url="https://two", access_key="c", secret_key="d"),
+        ]
+        storage.save(profiles)
 
-            loaded = storage.load()
+        loaded = storage.load()
 
-            self.assertEqual(profiles, loaded)
+        self.assertEqual(profiles, loaded)
 
     def test_load_returns_empty_on_invalid_file(self):
-        with tempfile.TemporaryDirectory() as tmp:
-            path = Path(tmp) / "connections.json"
-            path.write_text("not json", encoding="utf-8")
-            storage = ProfileStorage(path)
+        path = _TMP.path_for(self)
+        path.write_text("not json", encoding="utf-8")
+        storage = ProfileStorage(path)
 
-            self.assertEqual([], storage.load())
+        self.assertEqual([], storage.load())
 
 
 if __name__ == "__main__":
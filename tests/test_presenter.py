@@ -0,0 +1,157 @@
+import queue
+import threading
+import unittest
+
+from s3_browser.presenter import S3BrowserPresenter, _DaemonWorkerPool
+from s3_browser.settings import AppSettings
+
+
+class FakeSettingsStorage:
+    def __init__(self):
+        self.saved = []
+
+    def load(self) -> AppSettings:
+        return AppSettings()
+
+    def save(self, settings: AppSettings) -> None:
+        self.saved.append(settings)
+
+
+class FakeController:
+    def __init__(self, progress_totals=()):
+        self.progress_totals = progress_totals
+        self.download_calls = []
+        self.refresh_calls = 0
+        self.refresh_thread = None
+        self.refresh_started = threading.Event()
+        self.refresh_release = threading.Event()
+
+    def refresh_buckets(self):
+        self.refresh_calls += 1
+        self.refresh_thread = threading.current_thread()
+        self.refresh_started.set()
+        self.refresh_release.wait(5)
+        return []
+
+    def download_object(self, *, progress_callback=None, cancel_requested=None, **kwargs):
+        self.download_calls.append(kwargs)
+        for total in self.progress_totals:
+            progress_callback(total)
+
+
+class S3BrowserPresenterTests(unittest.TestCase):
+    def _presenter(self, controller, dispatch) -> S3BrowserPresenter:
+        presenter = S3BrowserPresenter(
+            controller=controller,
+            settings_storage=FakeSettingsStorage(),
+            dispatch=dispatch,
+        )
+        self.addCleanup(presenter.shutdown)
+        return presenter
+
+    def test_coalesce_progress_keeps_one_delivery_pending(self):
+        dispatched = []
+        received = []
+        presenter = self._presenter(FakeController(), dispatched.append)
+        report = presenter._coalesce_progress(received.append)
+
+        report(1024)
+        report(2048)
+        report(3072)
+
+        self.assertEqual(1, len(dispatched))
+        dispatched.pop()()
+        self.assertEqual([3072], received)
+
+        report(4096)
+
+        self.assertEqual(1, len(dispatched))
+        dispatched.pop()()
+        self.assertEqual([3072, 4096], received)
+
+    def test_download_object_queues_latest_progress_before_done(self):
+        dispatched = queue.SimpleQueue()
+        received = []
+        done = []
+        controller = FakeController(progress_totals=(1024, 2048, 3072))
+        presenter = self._presenter(controller, dispatched.put)
+
+        presenter.download_object(
+            bucket_name="bucket-one",
+            key="file.txt",
+            destination="file.txt",
+            on_progress=received.append,
+            on_done=lambda: done.append(True),
+        )
+        deliver_progress = dispatched.get(timeout=5)
+        finish = dispatched.get(timeout=5)
+
+        self.assertTrue(dispatched.empty())
+        deliver_progress()
+        finish()
+        self.assertEqual([3072], received)
+        self.assertEqual([True], done)
+        self.assertEqual(
+            [{"bucket_name": "bucket-one", "key": "file.txt", "destination": "file.txt", "version_id": None}],
+            controller.download_calls,
+        )
+
+    def test_shutdown_leaves_running_task_on_daemon_worker(self):
+        controller = FakeController()
+        self.addCleanup(controller.refresh_release.set)
+        presenter = self._presenter(controller, [].append)
+        presenter.refresh_buckets(on_success=lambda buckets: None, on_error=lambda message: None)
+        self.assertTrue(controller.refresh_started.wait(5))
+
+        presenter.shutdown()
+
+        self.assertTrue(controller.refresh_thread.is_alive())
+        self.assertTrue(controller.refresh_thread.daemon)
+
+    def test_submit_after_shutdown_is_ignored(self):
+        controller = FakeController()
+        controller.refresh_release.set()
+        presenter = self._presenter(controller, [].append)
+
+        presenter.shutdown()
+        presenter.refresh_buckets(on_success=lambda buckets: None, on_error=lambda message: None)
+
+        self.assertEqual([], presenter._workers._threads)
+        self.assertEqual(0, controller.refresh_calls)
+
+    def test_worker_pool_reuses_idle_thread(self):
+        pool = _DaemonWorkerPool(4, "reuse")
+        self.addCleanup(pool.shutdown)
+        served = queue.SimpleQueue()
+
+        pool.submit(lambda: served.put(threading.current_thread()))
+        first = served.get(timeout=5)
+        # The worker marks itself idle just after the task returns.
+        self.assertTrue(pool._idle.acquire(timeout=5))
+        pool._idle.release()
+        pool.submit(lambda: served.put(threading.current_thread()))
+        second = served.get(timeout=5)
+
+        self.assertIs(first, second)
+        self.assertTrue(first.daemon)
+        self.assertEqual(
+            [first],
+            [thread for thread in threading.enumerate() if thread.name.startswith("reuse_")],
+        )
+
+    def test_cancel_check_reports_shutdown(self):
+        presenter = self._presenter(FakeController(), [].append)
+        requested = []
+        check = presenter._cancel_check(lambda: bool(requested))
+
+        self.assertFalse(check())
+        requested.append(True)
+        self.assertTrue(check())
+        requested.clear()
+        presenter.shutdown()
+        self.assertTrue(check())
+        self.assertTrue(presenter._cancel_check(None)())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,10 +1,22 @@
 import json
-import tempfile
+import os
 import unittest
 from pathlib import Path
 
 from s3_browser.profiles import ConnectionProfile, ProfileStorage
 
+from tests.tempdir import ModuleTempDir
+
+
+_TMP = ModuleTempDir()
+
+setUpModule = _TMP.create
+tearDownModule = _TMP.cleanup
+
+
+def _write_payload(path: Path, payload: list[dict[str, str]]) -> None:
+    path.write_bytes(json.dumps(payload).encode("utf-8"))
+
 
 class FakeKeychain:
     def __init__(self):
@@ -26,67 +38,74 @@ class FakeKeychain:
 
 class ProfileStorageTests(unittest.TestCase):
     def test_load_migrates_plaintext_secrets(self):
-        with tempfile.TemporaryDirectory() as tmp:
-            path = Path(tmp) / "connections.json"
-            payload = [
-                {
-                    "name": "alpha",
-                    "endpoint_url": "https://one",
-                    "access_key": "a",
-                    "secret_key": "secret",
-                }
-            ]
-            path.write_text(json.dumps(payload), encoding="utf-8")
-            storage = ProfileStorage(path)
-            fake_keychain = FakeKeychain()
-            storage._keychain = fake_keychain
-
-            profiles = storage.load()
-
-            self.assertEqual("secret", profiles[0].secret_key)
-            self.assertEqual([("alpha", "secret")], fake_keychain.set_calls)
-            sanitized = json.loads(path.read_text(encoding="utf-8"))
-            self.assertNotIn("secret_key", sanitized[0])
+        path = _TMP.path_for(self)
+        payload = [
+            {
+                "name": "alpha",
+                "endpoint_url": "https://one",
+                "access_key": "a",
+                "secret_key": "secret",
+            }
+        ]
+        _write_payload(path, payload)
+        storage = ProfileStorage(path)
+        fake_keychain = FakeKeychain()
+        storage._keychain = fake_keychain
+
+        profiles = storage.load()
+
+        self.assertEqual("secret", profiles[0].secret_key)
+        self.assertEqual([("alpha", "secret")], fake_keychain.set_calls)
+        self.assertNotIn(b'"secret_key"', path.read_bytes())
 
     def test_load_uses_keychain_when_secret_missing(self):
-        with tempfile.TemporaryDirectory() as tmp:
-            path = Path(tmp) / "connections.json"
-            payload = [
-                {
-                    "name": "alpha",
-                    "endpoint_url": "https://one",
-                    "access_key": "a",
-                }
-            ]
-            path.write_text(json.dumps(payload), encoding="utf-8")
-            storage = ProfileStorage(path)
-            fake_keychain = FakeKeychain()
-            fake_keychain.secrets["alpha"] = "stored-secret"
-            storage._keychain = fake_keychain
-
-            profiles = storage.load()
-
-            self.assertEqual("stored-secret", profiles[0].secret_key)
+        path = _TMP.path_for(self)
+        payload = [
+            {
+                "name": "alpha",
+                "endpoint_url": "https://one",
+                "access_key": "a",
+            }
+        ]
+        _write_payload(path, payload)
+        storage = ProfileStorage(path)
+        fake_keychain = FakeKeychain()
+        fake_keychain.secrets["alpha"] = "stored-secret"
+        storage._keychain = fake_keychain
+
+        profiles = storage.load()
+
+        self.assertEqual("stored-secret", profiles[0].secret_key)
 
     def test_save_deletes_removed_keychain_entries(self):
-        with tempfile.TemporaryDirectory() as tmp:
-            path = Path(tmp) / "connections.json"
-            payload = [
-                {"name": "alpha", "endpoint_url": "https://one", "access_key": "a"},
-                {"name": "beta", "endpoint_url": "https://two", "access_key": "b"},
-            ]
-            path.write_text(json.dumps(payload), encoding="utf-8")
-            storage = ProfileStorage(path)
-            fake_keychain = FakeKeychain()
-            storage._keychain = fake_keychain
-
-            profiles = [
-                ConnectionProfile(name="alpha", endpoint_url="https://one", access_key="a", secret_key="secret"),
-            ]
-            storage.save(profiles)
-
-            self.assertEqual(["beta"], fake_keychain.delete_calls)
-            self.assertEqual([("alpha", "secret")], fake_keychain.set_calls)
+        path = _TMP.path_for(self)
+        payload = [
+            {"name": "alpha", "endpoint_url": "https://one", "access_key": "a"},
+            {"name": "beta", "endpoint_url": "https://two", "access_key": "b"},
+        ]
+        _write_payload(path, payload)
+        storage = ProfileStorage(path)
+        fake_keychain = FakeKeychain()
+        storage._keychain = fake_keychain
+
+        profiles = [
+            ConnectionProfile(name="alpha", endpoint_url="https://one", access_key="a", secret_key="secret"),
+        ]
+        storage.save(profiles)
+
+        self.assertEqual(["beta"], fake_keychain.delete_calls)
+        self.assertEqual([("alpha", "secret")], fake_keychain.set_calls)
+
+    @unittest.skipIf(os.name == "nt", "POSIX permissions only")
+    def test_save_creates_owner_only_file(self):
+        path = _TMP.path_for(self)
+        storage = ProfileStorage(path)
+        storage._keychain = FakeKeychain()
+
+        storage.save([])
+
+        self.assertEqual(0o600, path.stat().st_mode & 0o777)
+        self.assertEqual([], json.loads(path.read_text(encoding="utf-8")))
 
 
 if __name__ == "__main__":
@@ -1,4 +1,5 @@
 import unittest
+from contextlib import contextmanager
 from datetime import datetime
 
 try:
@@ -9,12 +10,41 @@ except ModuleNotFoundError:  # pragma: no cover - fallback for local testing
 from s3_browser import services
 from s3_browser.services import S3BrowserService, TransferCancelledError
 
+# Shared, never mutated: FakeS3Client wraps each page list in a fresh iterator.
+_EMPTY_LISTING = {"bucket-one": [{"Contents": []}]}
+_CONN = {"endpoint_url": "https://example.com", "access_key": "access", "secret_key": "secret"}
+_INVALID_PRESIGN_CASES = (
+    {"method": "delete"},
+    {"method": "get", "expires_in": 0},
+    {"method": "post", "post_key_mode": "single", "max_size": 0},
+    {"method": "post", "post_key_mode": "unknown", "max_size": 10},
+)
+
+
+def _service_for(fake_client) -> S3BrowserService:
+    return S3BrowserService(client_factory=lambda *_, **__: fake_client)
+
+
+class _FakeTransferConfig:
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+
+
+@contextmanager
+def _patched_transfer_config():
+    original_config = services.TransferConfig
+    services.TransferConfig = _FakeTransferConfig
+    try:
+        yield
+    finally:
+        services.TransferConfig = original_config
+
 
 class FakeS3Client:
     def __init__(
         self,
         buckets,
-        object_responses,
+        object_responses=None,
         head_object_responses=None,
         download_errors=None,
         upload_errors=None,
@@ -26,7 +56,7 @@ class FakeS3Client:
         location_responses=None,
     ):
         self.buckets = buckets
-        self.object_responses = {name: iter(responses) for name, responses in object_responses.items()}
+        self.object_responses = {name: iter(responses) for name, responses in (object_responses or {}).items()}
         self.list_objects_calls = []
         self.list_objects_kwargs = []
         self.head_object_calls = []
@@ -36,6 +66,7 @@ class FakeS3Client:
         self.upload_file_calls = []
         self.upload_file_errors = upload_errors or {}
         self.upload_file_configs = []
+        self.download_file_configs = []
         self.delete_object_calls = []
         self.delete_object_errors = delete_errors or {}
         self.presigned_url_outputs = presigned_url_outputs or {}
@@ -71,8 +102,9 @@ class FakeS3Client:
             raise response
         return response
 
-    def download_file(self, bucket, key, filename, Callback=None, ExtraArgs=None):
+    def download_file(self, bucket, key, filename, Callback=None, ExtraArgs=None, Config=None):
         self.download_file_calls.append((bucket, key, filename, ExtraArgs or {}))
+        self.download_file_configs.append(Config)
         error = self.download_file_errors.get((bucket, key))
         if isinstance(error, Exception):
             raise error
@@ -168,12 +200,10 @@ class S3BrowserServiceTests(unittest.TestCase):
             ],
         }
         fake_client = FakeS3Client(["bucket-one", "bucket-two"], object_responses)
-        service = S3BrowserService(client_factory=lambda *_, **__: fake_client)
+        service = _service_for(fake_client)
 
         listings = service.list_buckets_with_objects(
-            endpoint_url="https://example.com",
-            access_key="access",
-            secret_key="secret",
+            **_CONN,
             max_keys=10,
         )
 
@@ -208,12 +238,10 @@ class S3BrowserServiceTests(unittest.TestCase):
             "ListObjectsV2",
         )
         fake_client = FakeS3Client(["bucket-one"], {"bucket-one": [list_error]})
-        service = S3BrowserService(client_factory=lambda *_, **__: fake_client)
+        service = _service_for(fake_client)
 
         listings = service.list_buckets_with_objects(
-            endpoint_url="https://example.com",
-            access_key="access",
-            secret_key="secret",
+            **_CONN,
         )
 
         self.assertEqual(1, len(listings))
@@ -231,12 +259,10 @@ class S3BrowserServiceTests(unittest.TestCase):
             ]
         }
         fake_client = FakeS3Client(["bucket-one"], object_responses)
-        service = S3BrowserService(client_factory=lambda *_, **__: fake_client)
+        service = _service_for(fake_client)
 
         listings = service.list_buckets_with_objects(
-            endpoint_url="https://example.com",
-            access_key="access",
-            secret_key="secret",
+            **_CONN,
             max_keys=1,
         )
 
@@ -258,12 +284,10 @@ class S3BrowserServiceTests(unittest.TestCase):
             ]
         }
         fake_client = FakeS3Client(["bucket-one"], object_responses)
-        service = S3BrowserService(client_factory=lambda *_, **__: fake_client)
+        service = _service_for(fake_client)
 
         listing = service.list_objects_for_bucket(
-            endpoint_url="https://example.com",
-            access_key="access",
-            secret_key="secret",
+            **_CONN,
             bucket_name="bucket-one",
             prefix="folder/",
         )
@@ -280,12 +304,10 @@ class S3BrowserServiceTests(unittest.TestCase):
             ]
         }
         fake_client = FakeS3Client(["bucket-one"], object_responses)
-        service = S3BrowserService(client_factory=lambda *_, **__: fake_client)
+        service = _service_for(fake_client)
 
         listing = service.list_objects_for_bucket(
-            endpoint_url="https://example.com",
-            access_key="access",
-            secret_key="secret",
+            **_CONN,
             bucket_name="bucket-one",
             continuation_token="token-1",
         )
@@ -307,13 +329,11 @@ class S3BrowserServiceTests(unittest.TestCase):
                 "Metadata": {"custom": "value"},
             }
         }
-        fake_client = FakeS3Client(["bucket-one"], {"bucket-one": [{"Contents": []}]}, head_responses)
-        service = S3BrowserService(client_factory=lambda *_, **__: fake_client)
+        fake_client = FakeS3Client(["bucket-one"], _EMPTY_LISTING, head_responses)
+        service = _service_for(fake_client)
 
         details = service.get_object_details(
-            endpoint_url="https://example.com",
-            access_key="access",
-            secret_key="secret",
+            **_CONN,
             bucket_name="bucket-one",
             key="a.txt",
         )
@@ -329,13 +349,11 @@ class S3BrowserServiceTests(unittest.TestCase):
         self.assertEqual("a.txt", fake_client.head_object_calls[0]["Key"])
 
     def test_download_object_saves_to_destination(self):
-        fake_client = FakeS3Client(["bucket-one"], {"bucket-one": [{"Contents": []}]})
-        service = S3BrowserService(client_factory=lambda *_, **__: fake_client)
+        fake_client = FakeS3Client(["bucket-one"], _EMPTY_LISTING)
+        service = _service_for(fake_client)
 
         service.download_object(
-            endpoint_url="https://example.com",
-            access_key="access",
-            secret_key="secret",
+            **_CONN,
             bucket_name="bucket-one",
             key="a.txt",
             destination="/tmp/a.txt",
@@ -343,14 +361,35 @@ class S3BrowserServiceTests(unittest.TestCase):
 
         self.assertEqual([("bucket-one", "a.txt", "/tmp/a.txt", {})], fake_client.download_file_calls)
 
+    def test_download_object_passes_transfer_config(self):
+        fake_client = FakeS3Client(["bucket-one"], _EMPTY_LISTING)
+        service = _service_for(fake_client)
+
+        with _patched_transfer_config():
+            service.download_object(
+                **_CONN,
+                bucket_name="bucket-one",
+                key="a.txt",
+                destination="/tmp/a.txt",
+            )
+
+        config = fake_client.download_file_configs[0]
+        self.assertEqual(
+            {
+                "multipart_threshold": services.DEFAULT_MULTIPART_THRESHOLD,
+                "multipart_chunksize": services.DEFAULT_MULTIPART_CHUNK_SIZE,
+                "max_concurrency": services.DEFAULT_MAX_CONCURRENCY,
+                "use_threads": True,
+            },
+            config.kwargs,
+        )
+
     def test_download_object_passes_version_id(self):
-        fake_client = FakeS3Client(["bucket-one"], {})
-        service = S3BrowserService(client_factory=lambda *_, **__: fake_client)
+        fake_client = FakeS3Client(["bucket-one"])
+        service = _service_for(fake_client)
 
         service.download_object(
-            endpoint_url="https://example.com",
-            access_key="access",
-            secret_key="secret",
+            **_CONN,
             bucket_name="bucket-one",
             key="a.txt",
             destination="/tmp/a.txt",
@@ -364,10 +403,10 @@ class S3BrowserServiceTests(unittest.TestCase):
         transfer_sequences = {("download", "bucket-one", "a.txt"): [1024, 2048, 1024]}
         fake_client = FakeS3Client(
             ["bucket-one"],
-            {"bucket-one": [{"Contents": []}]},
+            _EMPTY_LISTING,
             transfer_sequences=transfer_sequences,
         )
-        service = S3BrowserService(client_factory=lambda *_, **__: fake_client)
+        service = _service_for(fake_client)
 
         reported = []
         cancel_flag = {"value": False}
@@ -382,9 +421,7 @@ class S3BrowserServiceTests(unittest.TestCase):
 
         with self.assertRaises(TransferCancelledError):
             service.download_object(
-                endpoint_url="https://example.com",
-                access_key="access",
-                secret_key="secret",
+                **_CONN,
                 bucket_name="bucket-one",
                 key="a.txt",
                 destination="/tmp/a.txt",
@@ -395,13 +432,11 @@ class S3BrowserServiceTests(unittest.TestCase):
         self.assertEqual([1024, 3072], reported)
 
     def test_upload_object_sends_source_file(self):
-        fake_client = FakeS3Client(["bucket-one"], {"bucket-one": [{"Contents": []}]})
-        service = S3BrowserService(client_factory=lambda *_, **__: fake_client)
+        fake_client = FakeS3Client(["bucket-one"], _EMPTY_LISTING)
+        service = _service_for(fake_client)
 
         service.upload_object(
-            endpoint_url="https://example.com",
-            access_key="access",
-            secret_key="secret",
+            **_CONN,
             bucket_name="bucket-one",
             key="folder/a.txt",
             source_path="/tmp/local.txt",
@@ -413,21 +448,43 @@ class S3BrowserServiceTests(unittest.TestCase):
         )
         self.assertIsNotNone(fake_client.upload_file_configs[0])
 
+    def test_upload_object_sizes_connection_pool_for_concurrency(self):
+        fake_client = FakeS3Client(["bucket-one"], _EMPTY_LISTING)
+        client_configs = []
+
+        def client_factory(*_args, config=None, **_kwargs):
+            client_configs.append(config)
+            return fake_client
+
+        service = S3BrowserService(client_factory=client_factory)
+
+        for max_concurrency in (4, 64):
+            service.upload_object(
+                **_CONN,
+                bucket_name="bucket-one",
+                key="folder/a.txt",
+                source_path="/tmp/local.txt",
+                max_concurrency=max_concurrency,
+            )
+
+        self.assertEqual(
+            [services.MAX_POOL_CONNECTIONS, 64],
+            [config.max_pool_connections for config in client_configs],
+        )
+
     def test_upload_object_reports_progress(self):
         transfer_sequences = {("upload", "bucket-one", "folder/a.txt"): [512, 512, 256]}
         fake_client = FakeS3Client(
             ["bucket-one"],
-            {"bucket-one": [{"Contents": []}]},
+            _EMPTY_LISTING,
             transfer_sequences=transfer_sequences,
         )
-        service = S3BrowserService(client_factory=lambda *_, **__: fake_client)
+        service = _service_for(fake_client)
 
         reported = []
 
         service.upload_object(
-            endpoint_url="https://example.com",
-            access_key="access",
-            secret_key="secret",
+            **_CONN,
             bucket_name="bucket-one",
             key="folder/a.txt",
             source_path="/tmp/local.txt",
@@ -440,10 +497,10 @@ class S3BrowserServiceTests(unittest.TestCase):
         transfer_sequences = {("upload", "bucket-one", "folder/a.txt"): [512, 512]}
         fake_client = FakeS3Client(
             ["bucket-one"],
-            {"bucket-one": [{"Contents": []}]},
+            _EMPTY_LISTING,
             transfer_sequences=transfer_sequences,
         )
-        service = S3BrowserService(client_factory=lambda *_, **__: fake_client)
+        service = _service_for(fake_client)
 
         cancel_flag = {"value": False}
 
@@ -455,9 +512,7 @@ class S3BrowserServiceTests(unittest.TestCase):
 
         with self.assertRaises(TransferCancelledError):
             service.upload_object(
-                endpoint_url="https://example.com",
-                access_key="access",
-                secret_key="secret",
+                **_CONN,
                 bucket_name="bucket-one",
                 key="folder/a.txt",
                 source_path="/tmp/local.txt",
@@ -466,20 +521,12 @@ class S3BrowserServiceTests(unittest.TestCase):
             )
 
     def test_upload_object_passes_transfer_config(self):
-        class FakeTransferConfig:
-            def __init__(self, **kwargs):
-                self.kwargs = kwargs
-
-        fake_client = FakeS3Client(["bucket-one"], {"bucket-one": [{"Contents": []}]})
-        service = S3BrowserService(client_factory=lambda *_, **__: fake_client)
+        fake_client = FakeS3Client(["bucket-one"], _EMPTY_LISTING)
+        service = _service_for(fake_client)
 
-        original_config = services.TransferConfig
-        services.TransferConfig = FakeTransferConfig
-        try:
+        with _patched_transfer_config():
             service.upload_object(
-                endpoint_url="https://example.com",
-                access_key="access",
-                secret_key="secret",
+                **_CONN,
                 bucket_name="bucket-one",
                 key="folder/a.txt",
                 source_path="/tmp/local.txt",
@@ -487,8 +534,6 @@ class S3BrowserServiceTests(unittest.TestCase):
                 multipart_chunk_size=2048,
                 max_concurrency=3,
             )
-        finally:
-            services.TransferConfig = original_config
 
         config = fake_client.upload_file_configs[0]
         self.assertEqual(
@@ -501,20 +546,12 @@ class S3BrowserServiceTests(unittest.TestCase):
         )
 
     def test_upload_object_sanitizes_transfer_config(self):
-        class FakeTransferConfig:
-            def __init__(self, **kwargs):
-                self.kwargs = kwargs
-
-        fake_client = FakeS3Client(["bucket-one"], {"bucket-one": [{"Contents": []}]})
-        service = S3BrowserService(client_factory=lambda *_, **__: fake_client)
+        fake_client = FakeS3Client(["bucket-one"], _EMPTY_LISTING)
+        service = _service_for(fake_client)
 
-        original_config = services.TransferConfig
-        services.TransferConfig = FakeTransferConfig
-        try:
+        with _patched_transfer_config():
             service.upload_object(
-                endpoint_url="https://example.com",
-                access_key="access",
-                secret_key="secret",
+                **_CONN,
                 bucket_name="bucket-one",
                 key="folder/a.txt",
                 source_path="/tmp/local.txt",
@@ -522,8 +559,6 @@ class S3BrowserServiceTests(unittest.TestCase):
                 multipart_chunk_size=-5,
                 max_concurrency=0,
             )
-        finally:
-            services.TransferConfig = original_config
 
         config = fake_client.upload_file_configs[0]
         self.assertEqual(
@@ -536,13 +571,11 @@ class S3BrowserServiceTests(unittest.TestCase):
         )
 
     def test_delete_object_removes_target_file(self):
-        fake_client = FakeS3Client(["bucket-one"], {"bucket-one": [{"Contents": []}]})
-        service = S3BrowserService(client_factory=lambda *_, **__: fake_client)
+        fake_client = FakeS3Client(["bucket-one"], _EMPTY_LISTING)
+        service = _service_for(fake_client)
 
         service.delete_object(
-            endpoint_url="https://example.com",
-            access_key="access",
-            secret_key="secret",
+            **_CONN,
             bucket_name="bucket-one",
             key="folder/a.txt",
         )
@@ -553,13 +586,11 @@ class S3BrowserServiceTests(unittest.TestCase):
         )
 
     def test_delete_object_passes_version_id(self):
-        fake_client = FakeS3Client(["bucket-one"], {})
-        service = S3BrowserService(client_factory=lambda *_, **__: fake_client)
+        fake_client = FakeS3Client(["bucket-one"])
+        service = _service_for(fake_client)
 
         service.delete_object(
-            endpoint_url="https://example.com",
-            access_key="access",
-            secret_key="secret",
+            **_CONN,
             bucket_name="bucket-one",
             key="a.txt",
             version_id="v42",
@@ -570,17 +601,15 @@ class S3BrowserServiceTests(unittest.TestCase):
     def test_generate_presigned_get_url_passes_response_headers(self):
         fake_client = FakeS3Client(
             ["bucket-one"],
-            {"bucket-one": [{"Contents": []}]},
+            _EMPTY_LISTING,
             presigned_url_outputs={
                 ("get_object", "bucket-one", "file.txt"): "https://example.com/get",
             },
         )
-        service = S3BrowserService(client_factory=lambda *_, **__: fake_client)
+        service = _service_for(fake_client)
 
         url = service.generate_presigned_url(
-            endpoint_url="https://example.com",
-            access_key="access",
-            secret_key="secret",
+            **_CONN,
             bucket_name="bucket-one",
             key="file.txt",
             method="get",
@@ -591,29 +620,34 @@ class S3BrowserServiceTests(unittest.TestCase):
         )
 
         self.assertEqual("https://example.com/get", url)
-        self.assertEqual(1, len(fake_client.presigned_url_calls))
-        call = fake_client.presigned_url_calls[0]
-        self.assertEqual("get_object", call["method"])
-        self.assertEqual(600, call["expires_in"])
-        self.assertEqual("bucket-one", call["params"]["Bucket"])
-        self.assertEqual("file.txt", call["params"]["Key"])
-        self.assertEqual("text/plain", call["params"]["ResponseContentType"])
-        self.assertEqual("attachment", call["params"]["ResponseContentDisposition"])
+        self.assertEqual(
+            [
+                {
+                    "method": "get_object",
+                    "params": {
+                        "Bucket": "bucket-one",
+                        "Key": "file.txt",
+                        "ResponseContentType": "text/plain",
+                        "ResponseContentDisposition": "attachment",
+                    },
+                    "expires_in": 600,
+                }
+            ],
+            fake_client.presigned_url_calls,
+        )
 
     def test_generate_presigned_put_url_uses_put_object_operation(self):
         fake_client = FakeS3Client(
             ["bucket-one"],
-            {"bucket-one": [{"Contents": []}]},
+            _EMPTY_LISTING,
             presigned_url_outputs={
                 ("put_object", "bucket-one", "upload.bin"): "https://example.com/put",
             },
         )
-        service = S3BrowserService(client_factory=lambda *_, **__: fake_client)
+        service = _service_for(fake_client)
 
         url = service.generate_presigned_url(
-            endpoint_url="https://example.com",
-            access_key="access",
-            secret_key="secret",
+            **_CONN,
             bucket_name="bucket-one",
             key="upload.bin",
             method="put",
@@ -631,7 +665,7 @@ class S3BrowserServiceTests(unittest.TestCase):
     def test_generate_presigned_post_builds_prefix_conditions(self):
         fake_client = FakeS3Client(
             ["bucket-one"],
-            {"bucket-one": [{"Contents": []}]},
+            _EMPTY_LISTING,
             presigned_post_outputs={
                 ("bucket-one", "uploads/${filename}"): {
                     "url": "https://example.com/post",
@@ -639,12 +673,10 @@ class S3BrowserServiceTests(unittest.TestCase):
                 },
             },
         )
-        service = S3BrowserService(client_factory=lambda *_, **__: fake_client)
+        service = _service_for(fake_client)
 
         result = service.generate_presigned_url(
-            endpoint_url="https://example.com",
-            access_key="access",
-            secret_key="secret",
+            **_CONN,
             bucket_name="bucket-one",
             key="uploads",
             method="post",
@@ -667,53 +699,12 @@ class S3BrowserServiceTests(unittest.TestCase):
         self.assertEqual("text/plain", call["fields"]["Content-Type"])
 
     def test_generate_presigned_url_validates_inputs(self):
-        fake_client = FakeS3Client(["bucket-one"], {"bucket-one": [{"Contents": []}]})
-        service = S3BrowserService(client_factory=lambda *_, **__: fake_client)
-
-        with self.assertRaises(ValueError):
-            service.generate_presigned_url(
-                endpoint_url="https://example.com",
-                access_key="access",
-                secret_key="secret",
-                bucket_name="bucket-one",
-                key="file.txt",
-                method="delete",
-            )
+        fake_client = FakeS3Client(["bucket-one"], _EMPTY_LISTING)
+        service = _service_for(fake_client)
 
-        with self.assertRaises(ValueError):
-            service.generate_presigned_url(
-                endpoint_url="https://example.com",
-                access_key="access",
-                secret_key="secret",
-                bucket_name="bucket-one",
-                key="file.txt",
-                method="get",
-                expires_in=0,
-            )
-
-        with self.assertRaises(ValueError):
-            service.generate_presigned_url(
-                endpoint_url="https://example.com",
-                access_key="access",
-                secret_key="secret",
-                bucket_name="bucket-one",
-                key="file.txt",
-                method="post",
-                post_key_mode="single",
-                max_size=0,
-            )
-
-        with self.assertRaises(ValueError):
-            service.generate_presigned_url(
-                endpoint_url="https://example.com",
-                access_key="access",
-                secret_key="secret",
-                bucket_name="bucket-one",
-                key="file.txt",
-                method="post",
-                post_key_mode="unknown",
-                max_size=10,
-            )
+        for case in _INVALID_PRESIGN_CASES:
+            with self.subTest(**case), self.assertRaises(ValueError):
+                service.generate_presigned_url(**_CONN, bucket_name="bucket-one", key="file.txt", **case)
 
 
     def test_list_object_versions_returns_versions_and_delete_markers(self):
@@ -739,12 +730,10 @@ class S3BrowserServiceTests(unittest.TestCase):
                 ]
             },
         )
-        service = S3BrowserService(client_factory=lambda *_, **__: fake_client)
+        service = _service_for(fake_client)
 
         listing = service.list_object_versions(
-            endpoint_url="https://example.com",
-            access_key="access",
-            secret_key="secret",
+            **_CONN,
             bucket_name="bucket-one",
         )
 
@@ -782,12 +771,10 @@ class S3BrowserServiceTests(unittest.TestCase):
                 ]
             },
         )
-        service = S3BrowserService(client_factory=lambda *_, **__: fake_client)
+        service = _service_for(fake_client)
 
         listing = service.list_object_versions(
-            endpoint_url="https://example.com",
-            access_key="access",
-            secret_key="secret",
+            **_CONN,
             bucket_name="bucket-one",
         )
 
@@ -802,12 +789,10 @@ class S3BrowserServiceTests(unittest.TestCase):
                 ("bucket-one", "file.txt"): {"ContentLength": 42, "VersionId": "v99"},
             },
         )
-        service = S3BrowserService(client_factory=lambda *_, **__: fake_client)
+        service = _service_for(fake_client)
 
         details = service.get_object_details(
-            endpoint_url="https://example.com",
-            access_key="access",
-            secret_key="secret",
+            **_CONN,
             bucket_name="bucket-one",
             key="file.txt",
             version_id="v99",
@@ -824,12 +809,10 @@ class S3BrowserServiceTests(unittest.TestCase):
             versioning_responses={"bucket-one": {"Status": "Enabled"}},
             location_responses={"bucket-one": {"LocationConstraint": "eu-west-1"}},
         )
-        service = S3BrowserService(client_factory=lambda *_, **__: fake_client)
+        service = _service_for(fake_client)
 
         info = service.get_bucket_info(
-            endpoint_url="https://example.com",
-            access_key="access",
-            secret_key="secret",
+            **_CONN,
             bucket_name="bucket-one",
         )
 
@@ -846,12 +829,10 @@ class S3BrowserServiceTests(unittest.TestCase):
             versioning_responses={"bucket-one": {"Status": "Suspended"}},
             location_responses={"bucket-one": {"LocationConstraint": None}},
         )
-        service = S3BrowserService(client_factory=lambda *_, **__: fake_client)
+        service = _service_for(fake_client)
 
         info = service.get_bucket_info(
-            endpoint_url="https://example.com",
-            access_key="access",
-            secret_key="secret",
+            **_CONN,
             bucket_name="bucket-one",
         )
 
@@ -859,13 +840,11 @@ class S3BrowserServiceTests(unittest.TestCase):
         self.assertEqual("us-east-1", info.region)
 
     def test_get_bucket_info_disabled_when_status_missing(self):
-        fake_client = FakeS3Client(["bucket-one"], {})
-        service = S3BrowserService(client_factory=lambda *_, **__: fake_client)
+        fake_client = FakeS3Client(["bucket-one"])
+        service = _service_for(fake_client)
 
         info = service.get_bucket_info(
-            endpoint_url="https://example.com",
-            access_key="access",
-            secret_key="secret",
+            **_CONN,
             bucket_name="bucket-one",
         )
 
@@ -878,12 +857,10 @@ class S3BrowserServiceTests(unittest.TestCase):
             {},
             versioning_responses={"bucket-one": SvcBotoCoreError()},
         )
-        service = S3BrowserService(client_factory=lambda *_, **__: fake_client)
+        service = _service_for(fake_client)
 
         info = service.get_bucket_info(
-            endpoint_url="https://example.com",
-            access_key="access",
-            secret_key="secret",
+            **_CONN,
             bucket_name="bucket-one",
         )
 
@@ -1,19 +1,40 @@
+import shlex
 import unittest
+from datetime import date, datetime, timezone
 
 from s3_browser.ui_utils import (
+    build_signed_url_commands,
+    compose_s3_key,
+    escape_double_quoted,
+    format_last_modified,
+    format_size,
     parse_duration_seconds,
     parse_size_bytes,
+    prefix_segments,
     split_duration_seconds,
     split_size_bytes,
 )
 
+_SPLIT_SIZE_CASES = (
+    (1024 * 1024 * 1024, ("1", "GB")),
+    (2 * 1024 * 1024, ("2", "MB")),
+    (2 * 1024, ("2", "KB")),
+    (512, ("512", "B")),
+    (1536, ("1536", "B")),
+)
+_SPLIT_DURATION_CASES = (
+    (2 * 24 * 60 * 60, ("2", "Days")),
+    (3 * 60 * 60, ("3", "Hours")),
+    (15 * 60, ("15", "Minutes")),
+    (45, ("45", "Seconds")),
+)
+
 
 class UiUtilsTests(unittest.TestCase):
     def test_split_size_bytes_prefers_largest_unit(self):
-        self.assertEqual(("1", "GB"), split_size_bytes(1024 * 1024 * 1024))
-        self.assertEqual(("2", "MB"), split_size_bytes(2 * 1024 * 1024))
-        self.assertEqual(("2", "KB"), split_size_bytes(2 * 1024))
-        self.assertEqual(("512", "B"), split_size_bytes(512))
+        for size, expected in _SPLIT_SIZE_CASES:
+            with self.subTest(size=size):
+                self.assertEqual(expected, split_size_bytes(size))
 
     def test_split_size_bytes_defaults_for_non_positive(self):
         self.assertEqual(("1", "MB"), split_size_bytes(0))
@@ -25,10 +46,9 @@ class UiUtilsTests(unittest.TestCase):
         self.assertIsNone(parse_size_bytes("0", "KB"))
 
     def test_split_duration_seconds_prefers_largest_unit(self):
-        self.assertEqual(("2", "Days"), split_duration_seconds(2 * 24 * 60 * 60))
-        self.assertEqual(("3", "Hours"), split_duration_seconds(3 * 60 * 60))
-        self.assertEqual(("15", "Minutes"), split_duration_seconds(15 * 60))
-        self.assertEqual(("45", "Seconds"), split_duration_seconds(45))
+        for seconds, expected in _SPLIT_DURATION_CASES:
+            with self.subTest(seconds=seconds):
+                self.assertEqual(expected, split_duration_seconds(seconds))
 
     def test_split_duration_seconds_defaults_for_non_positive(self):
         self.assertEqual(("1", "Hours"), split_duration_seconds(0))
@@ -39,6 +59,80 @@ class UiUtilsTests(unittest.TestCase):
         self.assertIsNone(parse_duration_seconds("1", "Missing"))
         self.assertIsNone(parse_duration_seconds("0", "Seconds"))
 
+    def test_format_size_picks_unit_by_magnitude(self):
+        self.assertEqual("-", format_size(None))
+        self.assertEqual("0 B", format_size(-5))
+        self.assertEqual("1023 B", format_size(1023))
+        self.assertEqual("1.0 KB", format_size(1024))
+        self.assertEqual("1024.0 KB", format_size(1024 * 1024 - 1))
+        self.assertEqual("1.5 MB", format_size(3 * 512 * 1024))
+        self.assertEqual("2048.0 TB", format_size(2 * 1024**5))
+
+    def test_compose_s3_key_normalizes_prefix(self):
+        self.assertEqual("folder/file.txt", compose_s3_key(" /folder", "file.txt"))
+        self.assertEqual("file.txt", compose_s3_key("", " file.txt "))
+        with self.assertRaises(ValueError):
+            compose_s3_key("folder/", " ")
+
+    def test_prefix_segments_skips_empty_parts(self):
+        self.assertEqual(("a", "b"), prefix_segments("/a//b/"))
+        self.assertEqual((), prefix_segments(""))
+
+    def test_build_signed_url_commands_orders_post_fields(self):
+        wget_cmd, curl_cmd = build_signed_url_commands(
+            method="post",
+            url="https://example.com/bucket",
+            filename="file.txt",
+            post_fields={"policy": "p", "key": "uploads/file.txt", "acl": "private"},
+        )
+        self.assertIsNone(wget_cmd)
+        self.assertEqual(
+            'curl -X POST -F "key=uploads/file.txt" -F "acl=private" -F "policy=p" '
+            '-F "file=@PATH_TO_FILE" "https://example.com/bucket"',
+            curl_cmd,
+        )
+
+    def test_build_signed_url_commands_put_headers(self):
+        self.assertEqual(
+            (
+                'wget --method=PUT --body-file="f.txt" "https://u"',
+                'curl -T "f.txt" "https://u"',
+            ),
+            build_signed_url_commands(method="put", url="https://u", filename="f.txt"),
+        )
+        self.assertEqual(
+            (
+                'wget --method=PUT --body-file="f.txt" --header="Content-Type: text/plain" "https://u"',
+                'curl -T "f.txt" -H "Content-Type: text/plain" "https://u"',
+            ),
+            build_signed_url_commands(
+                method="put", url="https://u", filename="f.txt", content_type="text/plain"
+            ),
+        )
+
+    def test_escape_double_quoted_escapes_shell_specials(self):
+        self.assertEqual("https://u?a=1&b=2", escape_double_quoted("https://u?a=1&b=2"))
+        self.assertEqual('a\\"b\\$c\\`d\\\\e', escape_double_quoted('a"b$c`d\\e'))
+        _, curl_cmd = build_signed_url_commands(
+            method="put",
+            url="https://u",
+            filename="f.txt",
+            content_disposition='attachment; filename="x.txt"',
+        )
+        self.assertEqual(
+            ["curl", "-T", "f.txt", "-H", 'Content-Disposition: attachment; filename="x.txt"', "https://u"],
+            shlex.split(curl_cmd),
+        )
+
+    def test_format_last_modified_accepts_dates_and_plain_values(self):
+        self.assertEqual("-", format_last_modified(None))
+        self.assertEqual(
+            "2024-01-02 03:04:05 UTC",
+            format_last_modified(datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)),
+        )
+        self.assertEqual("2024-01-02 00:00:00", format_last_modified(date(2024, 1, 2)))
+        self.assertEqual("yesterday", format_last_modified("yesterday"))
+
 
 if __name__ == "__main__":
     unittest.main()